@@ -0,0 +1,483 @@
+"""Timing scripts for checking the game's performance.
+
+Run with `python benchmark.py [name]`; with no name, every benchmark runs.
+"""
+
+import gc
+import os
+import sys
+import lzma
+import pickle
+import tempfile
+import tracemalloc
+from functools import partial
+from time import perf_counter
+import numpy as np
+
+from components.utilities.simulation import Simulation, scenarios, build_crowd
+from components.utilities.saves import SaveStore
+from components.utilities.compression import codecs
+from components.environments.area import Area
+from components.environments.background import BackgroundSimulation
+from components.entities.entity import Entity
+from components.entities.minds.brawler_mind import Brawler
+from components.entities.minds.mind import Mind
+from components.entities.minds.wanderer_mind import Wanderer
+from components.environments.features import AcidBlob
+from components.items.corpse import Corpse
+from components.items.consumables import AcidFlask
+from components.utilities.states.target_state import ThrowState
+
+
+def crowd(count, mind=Brawler):
+    """Creates a simulation of an area with a crowd of waiting entities."""
+    return Simulation(partial(build_crowd, count, mind), policy="wait")
+
+
+def time_turns(simulation, turns=10):
+    """Returns the average time taken for a turn."""
+    return simulation.run(turns).elapsed / turns
+
+
+def crowd_scaling():
+    """Turn time as the number of entities in an area grows."""
+
+    print("Turn time against entity count")
+    for count in [10, 100, 250, 500, 1000]:
+        elapsed = time_turns(crowd(count))
+        print(f"{count:>6} entities: {elapsed * 1000:9.2f}ms per turn, "
+              f"{elapsed / count * 1e6:7.1f}us per entity")
+
+
+def chase_scaling():
+    """Turn time as a growing crowd of Brawlers chases the player."""
+
+    print("Turn time against chasing Brawler count")
+    for count in [10, 100, 1000]:
+        simulation = crowd(count)
+
+        # Give every Brawler somewhere to go
+        player = simulation.world.player
+        for entity in simulation.world.area.entities - {player}:
+            entity.mind.last_known_target = player.loc
+
+        elapsed = time_turns(simulation, 5)
+        print(f"{count:>6} brawlers: {elapsed * 1000:9.2f}ms per turn")
+
+
+def turn_throughput():
+    """Player turns per second with a crowd of idle entities."""
+
+    print("Turns per second against idle entity count")
+    for count in [10, 100, 1000, 3000]:
+        elapsed = time_turns(crowd(count, Mind), 20)
+        print(f"{count:>6} entities: {1 / elapsed:9.1f} turns/s")
+
+
+def type_views():
+    """Cost of reading the typed content views of a busy area."""
+
+    print("Entities/items/features access against object count")
+    for count in [100, 1000, 5000]:
+        area = crowd(count).world.area
+        area.add_contents([Corpse("other", i % 80, i // 80 % 50)
+                           for i in range(count)])
+
+        start = perf_counter()
+        for _ in range(1000):
+            area.entities, area.items, area.features
+        elapsed = (perf_counter() - start) / 1000
+
+        print(f"{count * 2:>6} objects: {elapsed * 1e6:9.2f}us per access")
+
+
+def frame_rendering():
+    """Time taken to draw a frame when nothing has moved."""
+
+    print("Frame time against entity count")
+    for count in [10, 1000]:
+        simulation = crowd(count)
+        console = simulation.engine.console
+
+        start = perf_counter()
+        for _ in range(100):
+            console.clear()
+            simulation.play.render(console)
+        elapsed = (perf_counter() - start) / 100
+
+        print(f"{count:>6} entities: {elapsed * 1000:9.2f}ms per frame")
+
+
+def deep_world(levels=20, count=200, mind=Mind):
+    """Creates a simulation of a world with many populated levels."""
+
+    simulation = crowd(count)
+    world = simulation.world
+
+    for area_id in range(1, levels):
+        area = Area(80, 50, world, f"level {area_id}", area_id)
+        world.areas.append(area)
+        area.add_contents([Entity("other", "Not you.", i % 80, i // 80,
+                                  mind=mind)
+                           for i in range(count)])
+        area.add_contents([Corpse("other", i % 80, 40 + i // 80)
+                           for i in range(count)])
+
+    return simulation
+
+
+def range_filling():
+    """Time taken to find the tiles within a radius of a point, the first
+    time and once remembered."""
+
+    print("Flood fill time against radius")
+    for radius in [3, 10, 30]:
+        area = crowd(0).world.area
+
+        start = perf_counter()
+        area.get_tiles_in_range(40, 25, radius)
+        first = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(100):
+            area.get_range_mask(40, 25, radius)
+        cached = (perf_counter() - start) / 100
+
+        print(f"{radius:>6} tiles: {first * 1e6:9.2f}us first, "
+              f"{cached * 1e6:7.2f}us remembered")
+
+
+def aiming():
+    """Time taken to draw the aiming overlay for a thrown flask, with the
+    cursor still and moving every frame."""
+
+    print("Aiming overlay time with 1000 entities")
+    simulation = crowd(1000)
+    player = simulation.world.player
+    console = simulation.engine.console
+
+    # Entering the state works out every tile that can be aimed at
+    start = perf_counter()
+    aim = ThrowState(simulation.engine, simulation.play, player,
+                     AcidFlask(player.x, player.y))
+    elapsed = perf_counter() - start
+    print(f"  {'enter':<8}{elapsed * 1e6:9.2f}us")
+
+    for label, moving in [("still", False), ("moving", True)]:
+        start = perf_counter()
+        for i in range(100):
+            if moving:
+                aim.set_cursor(player.x + i % 5, player.y + 1)
+            aim.render_cursor(console)
+        elapsed = (perf_counter() - start) / 100
+
+        print(f"  {label:<8}{elapsed * 1e6:9.2f}us per frame")
+
+
+def save_timing():
+    """Time taken to save a deep world, in full and after one turn."""
+
+    print("Save time for a 20-level world")
+    simulation = deep_world()
+    world = simulation.world
+
+    # The old format, for comparison
+    engine, world.engine = world.engine, None
+    start = perf_counter()
+    lzma.compress(pickle.dumps(world))
+    print(f"  whole world, lzma:  {(perf_counter() - start) * 1000:9.2f}ms")
+    world.engine = engine
+
+    with tempfile.TemporaryDirectory() as directory:
+        saves = SaveStore(directory)
+
+        start = perf_counter()
+        saves.save(world)
+        print(f"  first save:         {(perf_counter() - start) * 1000:9.2f}ms")
+
+        # Play a turn on one level, then save again
+        simulation.run(1)
+
+        start = perf_counter()
+        saves.save(world)
+        print(f"  after one turn:     {(perf_counter() - start) * 1000:9.2f}ms")
+
+        start = perf_counter()
+        saves.load()
+        print(f"  load:               {(perf_counter() - start) * 1000:9.2f}ms")
+
+
+def save_stall():
+    """Time the game is held up by a save, with and without the
+    background writer (which still pickles on the game thread)."""
+
+    print("Play stalled by a save of a 20-level world")
+    for label, background in [("in place", False),
+                              ("write behind", True)]:
+        with tempfile.TemporaryDirectory() as directory:
+            simulation = deep_world()
+            saves = SaveStore(directory)
+
+            # A full save, then one after a turn on a single level
+            for save in ["full", "one level"]:
+                start = perf_counter()
+                if background:
+                    saves.write_in_background(simulation.world)
+                else:
+                    saves.save(simulation.world)
+                stall = perf_counter() - start
+
+                # Keep playing while the save is written
+                simulation.run(1)
+                saves.wait()
+                total = perf_counter() - start
+
+                print(f"  {label:<14}{save:<10}{stall * 1000:9.2f}ms "
+                      f"stalled, {total * 1000:9.2f}ms until written")
+
+
+def codec_comparison():
+    """Save size and speed for each compression codec, against the
+    number of levels in the world."""
+
+    print("Save size and latency by codec and world size")
+    for levels in [1, 5, 20]:
+        world = deep_world(levels).world
+
+        for name in codecs:
+            with tempfile.TemporaryDirectory() as directory:
+                saves = SaveStore(directory, name)
+
+                # Write every level each time
+                for area in world.areas:
+                    area.dirty = True
+
+                start = perf_counter()
+                saves.save(world)
+                saved = perf_counter() - start
+
+                start = perf_counter()
+                saves.load(lazy=False)
+                loaded = perf_counter() - start
+
+                size = sum(os.path.getsize(os.path.join(directory, file))
+                           for file in os.listdir(directory))
+
+            print(f"{levels:>4} levels {name:<5}{size / 1024:9.0f}KiB, "
+                  f"save {saved * 1000:8.2f}ms, load {loaded * 1000:8.2f}ms")
+
+
+def mapped_loading():
+    """Load time and memory for a world of large levels, with and
+    without memory-mapped tile layers."""
+
+    print("Loading 10 levels of 500x500 tiles")
+    simulation = crowd(10)
+    world = simulation.world
+    for area_id in range(1, 10):
+        world.areas.append(Area(500, 500, world, f"level {area_id}",
+                                area_id))
+
+    for label, mapped in [("in memory", False), ("mapped", True)]:
+        with tempfile.TemporaryDirectory() as directory:
+            saves = SaveStore(directory, mapped=mapped)
+            for area in world.areas:
+                area.dirty = True
+            saves.save(world)
+
+            tracemalloc.start()
+            start = perf_counter()
+            loaded = saves.load(lazy=False)
+            elapsed = perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            # Release the mapped files before they are deleted
+            del loaded
+
+        print(f"  {label:<10}{elapsed * 1000:9.2f}ms, "
+              f"{memory / 1024 ** 2:7.1f}MiB allocated")
+
+
+def lazy_loading():
+    """Time to load a game and draw the first frame, against the
+    number of levels, with every area loaded or only those in use."""
+
+    print("Load time against world depth")
+    for levels in [5, 20, 80]:
+        simulation = deep_world(levels)
+        world = simulation.world
+
+        with tempfile.TemporaryDirectory() as directory:
+            saves = SaveStore(directory)
+            saves.save(world)
+
+            for label, lazy in [("all areas", False), ("lazy", True)]:
+
+                # Don't count clearing up after the last load
+                gc.collect()
+
+                start = perf_counter()
+                loaded = saves.load(lazy)
+                loaded.area
+                elapsed = perf_counter() - start
+
+                resident = sum(area.loaded for area in loaded.areas)
+                print(f"{levels:>4} levels {label:<10}"
+                      f"{elapsed * 1000:9.2f}ms, {resident} resident")
+
+
+def background_areas(levels=4, turns=100):
+    """Turn time with the other levels frozen, simulated in the same
+    process every turn, or simulated in worker processes."""
+
+    print(f"Turn time with {levels - 1} other levels of 500 Wanderers")
+    for label in ["frozen", "serial", "background"]:
+        simulation = deep_world(levels, 500, Wanderer)
+        world = simulation.world
+
+        # Keep every level in memory
+        world.resident_cap = levels
+        for area in world.areas:
+            world.get_area(area.area_id)
+        world.change_area(0)
+
+        if label == "background":
+            world.background = BackgroundSimulation()
+
+        start = perf_counter()
+        for _ in range(turns):
+            ticks = world.ticks
+            simulation.step()
+            if label == "serial":
+                for area in world.areas[1:]:
+                    area.pass_time(world.ticks - ticks)
+        elapsed = (perf_counter() - start) / turns
+
+        if world.background is not None:
+            world.background.collect(world, wait=True)
+
+        print(f"  {label:<12}{elapsed * 1000:9.2f}ms per turn")
+
+
+def transition_latency():
+    """Time taken to go down into a level of Wanderers and acid blobs
+    after it has been left alone for a number of turns, caught up in one
+    step or turn by turn."""
+
+    print("Level transition time against turns away")
+    for turns in [10, 100, 10000]:
+        for label in ["catch up", "every tick"]:
+
+            # Playing out thousands of turns takes far too long
+            if label == "every tick" and turns > 100:
+                continue
+
+            simulation = deep_world(2, 500, Wanderer)
+            world = simulation.world
+            player = world.player
+            level = world.areas[1]
+            level.add_contents([AcidBlob(i % 80, 45 + i // 80, duration=50)
+                                for i in range(200)])
+
+            # Time passes elsewhere
+            ticks = turns * 100 // player.body.speed
+            world.ticks += ticks
+
+            start = perf_counter()
+            if label == "every tick":
+                level.pass_time(ticks)
+                level.last_simulated = world.ticks
+            player.change_area(level)
+            elapsed = perf_counter() - start
+
+            print(f"{turns:>6} turns {label:<11}"
+                  f"{elapsed * 1000:9.2f}ms")
+
+
+def object_memory():
+    """Memory and pickle size for each entity and corpse."""
+
+    print("Bytes per object, for 1000 of each")
+    for label, make in [("entity", lambda i: Entity("other", "Not you.")),
+                        ("corpse", lambda i: Corpse("other"))]:
+
+        gc.collect()
+        tracemalloc.start()
+        objects = [make(i) for i in range(1000)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        size = len(pickle.dumps(objects))
+        print(f"  {label:<8}{memory / 1000:8.0f} bytes in memory, "
+              f"{size / 1000:6.0f} bytes pickled")
+
+
+def entity_queries():
+    """Finding the entities in the player's view, from packed arrays of
+    their positions and from the entities themselves."""
+
+    print("Entities in view against entity count")
+    for count in [100, 1000]:
+        area = crowd(count).world.area
+        view = area.calculate_fov(area.world.player)
+        entities = list(area.entities)
+
+        # Positions packed once, as a store of entity state would keep them
+        xs = np.array([entity.x for entity in entities])
+        ys = np.array([entity.y for entity in entities])
+
+        for label, query in [
+                ("arrays", lambda: [entities[i] for i in
+                                    np.flatnonzero(view[xs, ys])]),
+                ("loop", lambda: [entity for entity in entities
+                                  if view[entity.x, entity.y]])]:
+
+            start = perf_counter()
+            for _ in range(100):
+                query()
+            elapsed = (perf_counter() - start) / 100
+
+            print(f"{count:>6} entities {label:<7}"
+                  f"{elapsed * 1e6:9.2f}us per query")
+
+
+def scenario_suite():
+    """Full reports for each of the standard simulation scenarios."""
+
+    for name in scenarios:
+        print(f"Scenario: {name}")
+
+        for line in Simulation(name).run(50).summary():
+            print(line)
+
+        peak = Simulation(name).run(10, trace_memory=True).peak_memory
+        print(f"  peak memory over 10 turns {peak / 1024:.0f}KiB")
+
+
+benchmarks = {
+    "crowd": crowd_scaling,
+    "chase": chase_scaling,
+    "turns": turn_throughput,
+    "views": type_views,
+    "render": frame_rendering,
+    "range": range_filling,
+    "aim": aiming,
+    "save": save_timing,
+    "stall": save_stall,
+    "codecs": codec_comparison,
+    "mapped": mapped_loading,
+    "lazy": lazy_loading,
+    "background": background_areas,
+    "transition": transition_latency,
+    "memory": object_memory,
+    "store": entity_queries,
+    "suite": scenario_suite
+}
+
+
+if __name__ == "__main__":
+
+    chosen = sys.argv[1:] or list(benchmarks)
+    for name in chosen:
+        benchmarks[name]()
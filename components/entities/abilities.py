@@ -5,10 +5,14 @@ and the entity can use them to affect the world"""
 from ..environments.features import AcidBlob
 from ..entities.conditions import Lure
 from ..utilities.messages import AlertMessage
+from ..utilities.slotted import Slotted
 
 
-class Ability:
+class Ability(Slotted):
     """An in-game ability."""
+
+    __slots__ = ("name", "cooldown", "delay")
+
     def __init__(self, name, cooldown=0):
         self.name = name
         self.cooldown = cooldown
@@ -32,10 +36,16 @@ class Ability:
         if self.delay > 0:
             self.delay -= 1
 
+    def catch_up(self, turns):
+        """Counts the cooldown down by several turns at once."""
+        self.delay = max(0, self.delay - turns)
+
 
 class TargetAbility(Ability):
     """An ability that needs targetting."""
 
+    __slots__ = ("range",)
+
     def __init__(self, name, aim_range, cooldown=0):
         super().__init__(name, cooldown)
         self.range = aim_range
@@ -43,6 +53,9 @@ class TargetAbility(Ability):
 
 class FireAbility(TargetAbility):
     """An ability that can fire a projectile."""
+
+    __slots__ = ("ammunition",)
+
     def __init__(self, name, ammunition, aim_range, cooldown):
         super().__init__(name, aim_range, cooldown)
         self.ammunition = ammunition
@@ -55,6 +68,9 @@ class FireAbility(TargetAbility):
 
 class SpellAbility(TargetAbility):
     """A range ability with no projectile."""
+
+    __slots__ = ()
+
     def __init__(self, name, aim_range, cooldown):
         super().__init__(name, aim_range, cooldown)
 
@@ -66,6 +82,8 @@ class SpellAbility(TargetAbility):
 class AcidSpit(FireAbility):
     """Spit corrosive acid."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="acid spit",
                          ammunition=AcidBlob,
@@ -76,6 +94,8 @@ class AcidSpit(FireAbility):
 class LurePrey(SpellAbility):
     """Lure an entity towards you."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="lure prey",
                          aim_range=6,
@@ -4,14 +4,20 @@ and its subclasses. Actions are used to store information
 about entity movement/attacks/other.
 """
 
+from ..utilities.slotted import Slotted
 
-class Action:
+
+class Action(Slotted):
     """Base action class."""
 
+    __slots__ = ()
+
 
 class Surge(Action):
     """Base class for any action with a direction."""
 
+    __slots__ = ("dx", "dy")
+
     def __init__(self, dx, dy):
         super().__init__()
         self.dx = dx
@@ -21,6 +27,8 @@ class Surge(Action):
 class Handle(Action):
     """Base class for any action with an item."""
 
+    __slots__ = ("item",)
+
     def __init__(self, item=None):
         self.item = item
 
@@ -28,6 +36,8 @@ class Handle(Action):
 class Move(Surge):
     """Movement to an adjacent tile."""
 
+    __slots__ = ()
+
     def __init__(self, dx, dy):
         super().__init__(dx, dy)
 
@@ -35,6 +45,8 @@ class Move(Surge):
 class Attack(Action):
     """Melee attack."""
 
+    __slots__ = ("other",)
+
     def __init__(self, other):
         super().__init__()
         self.other = other
@@ -43,6 +55,8 @@ class Attack(Action):
 class PickUp(Handle):
     """Add an item to the inventory."""
 
+    __slots__ = ()
+
     def __init__(self, item=None):
         super().__init__(item)
 
@@ -50,6 +64,8 @@ class PickUp(Handle):
 class Drop(Handle):
     """Transfer an item from the inventory to the area."""
 
+    __slots__ = ()
+
     def __init__(self, item=None):
         super().__init__(item)
 
@@ -57,6 +73,8 @@ class Drop(Handle):
 class Use(Handle):
     """Use an item."""
 
+    __slots__ = ()
+
     def __init__(self, item=None):
         super().__init__(item)
 
@@ -64,6 +82,8 @@ class Use(Handle):
 class Equip(Handle):
     """Wield or wear an item."""
 
+    __slots__ = ()
+
     def __init__(self, item=None):
         super().__init__(item)
 
@@ -71,6 +91,8 @@ class Equip(Handle):
 class Unequip(Handle):
     """Return an item back to the inventory."""
 
+    __slots__ = ()
+
     def __init__(self, item=None):
         super().__init__(item)
 
@@ -78,6 +100,8 @@ class Unequip(Handle):
 class Throw(Handle):
     """Throw an item towards a tile."""
 
+    __slots__ = ("target",)
+
     def __init__(self, item=None, target=None):
         super().__init__(item)
         self.target = target
@@ -86,30 +110,44 @@ class Throw(Handle):
 class Interact(Action):
     """Interact with a feature."""
 
+    __slots__ = ()
+
 
 class Wait(Action):
     """Do nothing."""
 
+    __slots__ = ()
+
 
 class OpenMenu(Action):
     """Open the menu."""
 
+    __slots__ = ()
+
 
 class ViewLog(Action):
     """View the message log."""
 
+    __slots__ = ()
+
 
 class OpenInventory(Action):
     """Open the inventory."""
 
+    __slots__ = ()
+
 
 class Look(Action):
     """Look around the area."""
 
+    __slots__ = ()
+
 
 class Activate(Action):
     """Activate an ability."""
 
+    __slots__ = ("ability",)
+
     def __init__(self, ability=None):
         super().__init__()
         self.ability = ability
@@ -118,6 +156,8 @@ class Activate(Action):
 class Fire(Action):
     """Fire a projectile."""
 
+    __slots__ = ("projectile", "target")
+
     def __init__(self, projectile=None, target=None):
         super().__init__()
         self.projectile = projectile
@@ -127,6 +167,8 @@ class Fire(Action):
 class Evoke(Action):
     """Trigger a spell-like ability."""
 
+    __slots__ = ("ability", "target")
+
     def __init__(self, ability=None, target=None):
         super().__init__()
         self.ability = ability
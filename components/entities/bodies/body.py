@@ -5,11 +5,17 @@ This class stores physical information about in-game entities.
 
 from random import choice
 from ...utilities.messages import CombatMessage, WorldMessage
-from .body_parts import parts, HumanEyes, HumanHands, HumanLegs, HumanMouth, HumanSkin
+from .body_parts import parts, get_part, HumanEyes, HumanHands, HumanLegs, HumanMouth, HumanSkin
+from ..abilities import Ability
 from ...items.corpse import Corpse
 from collections import defaultdict
+from ...utilities.slotted import Slotted
+from ...environments.scheduler import Scheduler
 
-class Body:
+class Body(Slotted):
+    __slots__ = ("eyes", "manipulators", "propulsors", "exterior", "mouth",
+                 "part_abilities", "bonus_health", "health", "affinities",
+                 "instability", "owner")
 
     def __init__(self,
                  eyes=HumanEyes,
@@ -18,19 +24,19 @@ class Body:
                  exterior=HumanSkin,
                  mouth=HumanMouth):
 
+        # Abilities granted by parts, by part type
+        self.part_abilities = {}
+
         # The various body parts
-        self.eyes = eyes()
-        self.manipulators = manipulators()
-        self.propulsors = propulsors()
-        self.exterior = exterior()
-        self.mouth = mouth()
+        for part in [eyes, manipulators, propulsors, exterior, mouth]:
+            self.attach(part)
 
         # Health
         self.bonus_health = 0
         self.health = self.exterior.max_health
 
         # Instability and mutation
-        self.affinities = defaultdict(lambda: 0)
+        self.affinities = defaultdict(int)
         self.instability = 90
         
     # Properties derived from body parts
@@ -62,7 +68,7 @@ class Body:
     @property
     def abilities(self):
         # List of abilities granted by body parts
-        return [x.ability for x in self.parts if hasattr(x, "ability")]
+        return list(self.part_abilities.values())
 
     # Other properties
 
@@ -142,28 +148,49 @@ class Body:
 
         return choice(valid_parts)
 
+    def attach(self, part):
+        """Gives the body a kind of part, replacing any of the same type.
+        Returns the replaced part."""
+
+        new_part = get_part(part)
+        old_part = getattr(self, new_part.type, None)
+
+        # Parts change speed, so the owner's next turn is worked out again
+        area = getattr(getattr(self, "owner", None), "area", None)
+        queued = area is not None \
+            and area.scheduler.unqueue(self.owner, Scheduler.ENTITY)
+
+        setattr(self, new_part.type, new_part)
+
+        # Abilities come and go with their parts
+        self.part_abilities.pop(new_part.type, None)
+        if hasattr(new_part, "ability"):
+            self.part_abilities[new_part.type] = new_part.ability()
+
+        if queued:
+            area.scheduler.add(self.owner, Scheduler.ENTITY)
+
+        return old_part
+
     def mutate(self, part):
         """Actually transforms the body."""
-        new_part = part()
-
-        if new_part.type == "mouth":
-            old_part = self.mouth
-            self.mouth = new_part
-        elif new_part.type == "eyes":
-            old_part = self.eyes
-            self.eyes = new_part
-        elif new_part.type == "exterior":
-            old_part = self.exterior
-            self.exterior = new_part
-        elif new_part.type == "manipulators":
-            old_part = self.manipulators
-            self.manipulators = new_part
-        elif new_part.type == "propulsors":
-            old_part = self.propulsors
-            self.propulsors = new_part
+        new_part = get_part(part)
+        old_part = self.attach(part)
 
         self.owner.area.post(WorldMessage("You are racked with pain as your form shifts."))
         verb = "transforms" if old_part.type in ['exterior', 'mouth'] else 'transform'
         noun_phrase = new_part.article + ' ' + new_part.desc if hasattr(new_part, "article") else new_part.desc
         report = f"{self.owner.possessive_phrase} {old_part.desc} {verb} into {noun_phrase}!"
-        self.owner.area.post(WorldMessage(report))
\ No newline at end of file
+        self.owner.area.post(WorldMessage(report))
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+
+        # Bodies saved before parts were shared have their own parts,
+        # each holding its ability
+        if not hasattr(self, "part_abilities"):
+            self.part_abilities = {}
+            for part in self.parts:
+                setattr(self, part.type, get_part(type(part)))
+                if isinstance(getattr(part, "ability", None), Ability):
+                    self.part_abilities[part.type] = part.ability
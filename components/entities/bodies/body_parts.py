@@ -1,12 +1,29 @@
 """This file contains the implementations of the various body parts;
 Each organ/limb has different stat effects or grants different abilities.
+Parts never change, so each kind has one instance, shared by every body
+that has it; anything that varies, like an ability's cooldown, belongs to
+the body.
 """
 
 from ..abilities import AcidSpit
+from ...utilities.slotted import Slotted
 
-class Part:
+# The shared instance of each kind of part
+shared_parts = {}
+
+
+def get_part(part):
+    """Returns the shared instance of a kind of part."""
+    if part not in shared_parts:
+        shared_parts[part] = part()
+    return shared_parts[part]
+
+
+class Part(Slotted):
     """A generic body part."""
 
+    __slots__ = ("name", "desc", "affinity", "type", "prerequisites")
+
     def __init__(self, name, desc, affinity='human', type=None):
         self.name = name
         self.desc = desc
@@ -17,11 +34,17 @@ class Part:
     def __repr__(self):
         return f"body part ({self.name})"
 
+    def __reduce__(self):
+        # Saved by kind, and loaded as the shared instance
+        return (get_part, (type(self),))
+
 ## Eyes
 
 class Eyes(Part):
     """Sensory organ."""
 
+    __slots__ = ("view_radius",)
+
     def __init__(self, name, desc, view_radius, affinity='human'):
         super().__init__(name, desc, affinity, type="eyes")
         self.view_radius = view_radius
@@ -30,6 +53,8 @@ class Eyes(Part):
 class HumanEyes(Eyes):
     """Totally normal human eyes."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("eyes", "normal human eyes", 5, affinity='human')
 
@@ -37,6 +62,8 @@ class HumanEyes(Eyes):
 class Eyestalks(Eyes):
     """Snail eyes on tentacles."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("eyestalks", "soft eye-tipped tentacles", 3,
                          affinity='snail')
@@ -46,6 +73,8 @@ class Eyestalks(Eyes):
 class Manipulators(Part):
     """Grasping limbs/pseudopods/similar"""
 
+    __slots__ = ("can_equip", "verb", "damage", "strength")
+
     def __init__(self, name, desc, can_equip, verb='flail', damage=1, strength=5, affinity='human'):
         super().__init__(name, desc, affinity, type="manipulators")
         self.can_equip = can_equip
@@ -57,6 +86,8 @@ class Manipulators(Part):
 class HumanHands(Manipulators):
     """Normal human arms and hands."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("hands", "normal human arms and hands", can_equip=True, verb="strike", damage=1, strength=5)
 
@@ -64,6 +95,8 @@ class HumanHands(Manipulators):
 class SmallCrabClaws(Manipulators):
     """Small, clutching claws."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("small crab claws", "small clutching claws", can_equip=False, verb="snip",
                          damage=2, strength=4, affinity='crab')
@@ -73,6 +106,8 @@ class SmallCrabClaws(Manipulators):
 class Propulsors(Part):
     """Limbs and such for locomotion."""
 
+    __slots__ = ("speed",)
+
     def __init__(self, name, desc, speed=10, affinity='human'):
         super().__init__(name, desc, affinity, type="propulsors")
         self.speed = speed
@@ -81,12 +116,16 @@ class Propulsors(Part):
 class HumanLegs(Propulsors):
     """Normal human legs and feet."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("legs", "normal human legs and feet", speed=10, affinity='human')
 
 class CrabLegs(Propulsors):
     """Normal human legs and feet."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("crab legs", "six chitinous, segmented limbs", speed=10, affinity='crab')
 
@@ -95,6 +134,8 @@ class CrabLegs(Propulsors):
 class Exterior(Part):
     """Flesh and carapaces."""
 
+    __slots__ = ("max_health", "defence")
+
     def __init__(self, name, desc, max_health=10, defence=0, affinity='human'):
         super().__init__(name, desc, affinity, type="exterior")
         self.max_health = max_health
@@ -107,6 +148,8 @@ class Exterior(Part):
 class HumanSkin(Exterior):
     """Normal human skin."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("skin", "normal human skin", max_health=10, defence=0, affinity='human')
 
@@ -114,6 +157,8 @@ class HumanSkin(Exterior):
 class ThinCrabShell(Exterior):
     """First level of crab defence."""
 
+    __slots__ = ("article",)
+
     def __init__(self):
         super().__init__("shell", "thin crab shell", max_health=10, defence=5, affinity='crab')
         self.article = "a"
@@ -122,6 +167,9 @@ class ThinCrabShell(Exterior):
 
 class Mouth(Part):
     """Biting and spitting."""
+
+    __slots__ = ()
+
     def __init__(self, name, desc, affinity='human'):
         super().__init__(name, desc, affinity, type="mouth")
 
@@ -131,6 +179,9 @@ class Mouth(Part):
 
 class HumanMouth(Mouth):
     """Normal human mouth."""
+
+    __slots__ = ("article",)
+
     def __init__(self):
         super().__init__(name="mouth", desc="normal human mouth", affinity="human")
         self.article = "a"
@@ -138,10 +189,15 @@ class HumanMouth(Mouth):
 
 class AcidSpittingMouth(Mouth):
     """Spit acid."""
+
+    __slots__ = ("article", "ability")
+
     def __init__(self, name="acid-spitting mouth", desc="acid-spitting mouth", affinity='toad'):
         super().__init__(name, desc, affinity)
         self.article = "an"
-        self.ability = AcidSpit()
+
+        # Each body with this part gets its own copy of the ability
+        self.ability = AcidSpit
 
     def on_contact(self, other):
         pass
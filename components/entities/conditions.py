@@ -4,11 +4,14 @@ conditions, such as poison."""
 
 from ..utilities.messages import AlertMessage
 from ..entities.minds.seeker_mind import Seeker
+from ..utilities.slotted import Slotted
 
 
-class Condition:
+class Condition(Slotted):
     """A temporary status condition."""
 
+    __slots__ = ("duration", "target")
+
     def __init__(self, duration, target):
         self.duration = duration
         self.target = target
@@ -45,10 +48,18 @@ class Condition:
             # Remove the condition
             self.remove()
 
+    def catch_up(self, turns):
+        """Counts down several turns at once, without their effects."""
+        self.duration -= turns
+        if self.duration <= 0:
+            self.remove()
+
 
 class Poison(Condition):
     """Reduce health each turn."""
 
+    __slots__ = ("damage",)
+
     def __init__(self, duration, damage, target):
         super().__init__(duration, target)
         self.damage = damage
@@ -61,10 +72,17 @@ class Poison(Condition):
         self.target.area.post(AlertMessage(text))
         self.target.body.take_damage(self.damage)
 
+    def catch_up(self, turns):
+        """Deals all the missed damage at once."""
+        self.target.body.take_damage(self.damage * min(turns, self.duration))
+        super().catch_up(turns)
+
 
 class Lure(Condition):
     """Move towards danger."""
 
+    __slots__ = ("goal", "mind", "normal_state")
+
     def __init__(self, duration, target, goal):
         self.goal = goal
         self.mind = Seeker(self.goal)
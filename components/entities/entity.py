@@ -9,7 +9,6 @@ from ..utilities.messages import DeathMessage
 from .bodies.body import Body
 from .minds.mind import Mind
 from .actions import Wait, Move, Attack, PickUp
-import numpy as np
 from ..environments.features import Stairs
 from ..items.items import Equippable, Weapon, Armour
 
@@ -17,6 +16,9 @@ from ..items.items import Equippable, Weapon, Armour
 class Entity(Object):
     """The base class for all animate game objects"""
 
+    __slots__ = ("faction", "body", "readiness", "mind", "inventory",
+                 "conditions", "verb_addition")
+
     def __init__(self,
                  name="entity",
                  description="A living being.",
@@ -152,8 +154,7 @@ class Entity(Object):
 
     def move(self, dx, dy):
         """Alters the entity's position by a given amount."""
-        self.x += dx
-        self.y += dy
+        self.set_loc(self.x + dx, self.y + dy)
 
     def attack(self, other):
         """Attacks another entity."""
@@ -173,7 +174,7 @@ class Entity(Object):
 
         # Replace the entity with a corpse
         corpse = self.body.create_corpse()
-        self.area.contents.add(corpse)
+        self.area.add_contents(corpse)
 
         # Drop the entity's inventory
         for item in list(self.inventory):
@@ -200,22 +201,6 @@ class Entity(Object):
         if item.uses <= 0:
             self.inventory.remove(item)
 
-    def get_tile_costs(self):
-        """Calculate the cost of movement around the area
-        for this specific entity."""
-
-        # Make a copy of the passable map
-        cost = np.array(self.area.tiles["passable"], dtype=np.int8)
-
-        # Squares containing entities have a higher cost
-        # - discourage routing through them
-        for entity in self.area.entities:
-            if entity.blocks and cost[entity.x, entity.y]:
-                cost[entity.x, entity.y] += 10
-
-        # Return the cost map
-        return cost
-
     def throw(self, item, target):
         """Throw an object towards a location."""
 
@@ -229,7 +214,7 @@ class Entity(Object):
         self.area.add_contents(item)
 
         # Move it to the right tile
-        item.x, item.y = target
+        item.set_loc(*target)
 
         item.impact()
 
@@ -275,7 +260,7 @@ class Entity(Object):
         self.area.add_contents(projectile)
 
         # Move it to the right tile
-        projectile.x, projectile.y = target
+        projectile.set_loc(*target)
 
         projectile.impact()
 
@@ -286,6 +271,20 @@ class Entity(Object):
 
         ability.apply(self, target)
 
+    def catch_up(self, turns):
+        """Makes up for a number of missed turns at once."""
+
+        for condition in list(self.conditions):
+            condition.catch_up(turns)
+
+        for ability in list(self.body.abilities):
+            ability.catch_up(turns)
+
+        # Conditions may have been fatal
+        mind = getattr(self, "mind", None)
+        if mind and self.area:
+            mind.catch_up(turns)
+
     def update(self):
         """Carry out regular checks and actions."""
         # Apply each condition
@@ -24,13 +24,10 @@ class Brawler(Mind):
             # clear the position
             self.last_known_target = None
 
-        # Calculate the entity's field of view
-        visible = self.area.calculate_fov(self.owner)
-
-        # Search the entity list for a visible & attackable one
+        # Search for a visible & attackable entity
         # Currently just attacks the player - further functionality planned
-        for entity in self.area.entities:
-            if visible[entity.x, entity.y] and entity.faction == "player":
+        for entity in self.area.get_faction("player"):
+            if self.area.can_see(self.owner, entity):
 
                 # Set the target, and its last known location
                 self.target = entity
@@ -43,14 +40,10 @@ class Brawler(Mind):
         # Calculate the next step towards the goal
         goal = (self.target.x,
                 self.target.y) if self.target else self.last_known_target
-        path = self.area.get_path_to(self.owner, goal[0], goal[1])
-
-        # If there is a path
-        if path:
-            # Grab the next point on it
-            next_step = path[0]
-        else:
-            # Otherwise just pause
+        next_step = self.area.get_step_towards(self.owner, goal[0], goal[1])
+
+        # If there is no way forward, just pause
+        if not next_step:
             return Wait()
 
         # Calculate the movement required
@@ -60,7 +53,7 @@ class Brawler(Mind):
         # If the target is in view
         if self.target:
             # If it's close enough to attack,
-            if next_step == [self.target.x, self.target.y]:
+            if next_step == self.target.loc:
                 # Attack
                 return Attack(self.target)
 
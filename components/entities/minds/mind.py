@@ -14,6 +14,10 @@ class Mind():
 
         return Wait()
 
+    def catch_up(self, turns):
+        """Makes up for a number of missed turns at once."""
+        pass
+
     @property
     def area(self):
         """Utility - return the owner's area."""
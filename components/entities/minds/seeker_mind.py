@@ -15,23 +15,16 @@ class Seeker(Mind):
     def make_decision(self):
         """Moves towards the target if possible."""
 
-        # Calculate the entity's field of view
-        visible = self.area.calculate_fov(self.owner)
-
         # Check that the target is visible
-        if not visible[self.target.x, self.target.y]:
+        if not self.area.can_see(self.owner, self.target):
             return Wait()
 
         # Calculate the next step towards the goal
         goal = self.target.loc
-        path = self.area.get_path_to(self.owner, goal[0], goal[1])
-
-        # If there is a path
-        if path:
-            # Grab the next point on it
-            next_step = path[0]
-        else:
-            # Otherwise just pause
+        next_step = self.area.get_step_towards(self.owner, goal[0], goal[1])
+
+        # If there is no way forward, just pause
+        if not next_step:
             return Wait()
 
         # Calculate the movement required
@@ -5,12 +5,40 @@ This mind chooses passive, random movement.
 from .mind import Mind
 from ..actions import Move, Wait
 from random import choice
+from math import isqrt
+import numpy as np
 from ...utilities.constants import DIRECTIONS
 
 
 class Wanderer(Mind):
     """Moves randomly, with no awareness."""
 
+    def catch_up(self, turns):
+        """Moves to a free tile within the distance a random walk of that
+        many turns would typically cover."""
+
+        x, y = self.owner.loc
+        reach = isqrt(turns)
+        if not reach:
+            return
+
+        # Only look at tiles in range
+        left, top = max(0, x - reach), max(0, y - reach)
+        window = (slice(left, min(self.area.width, x + reach + 1)),
+                  slice(top, min(self.area.height, y + reach + 1)))
+        xs, ys = np.ogrid[window]
+
+        # Free tiles in range, connected to the current one
+        regions = self.area.get_regions()
+        nearby = (abs(xs - x) + abs(ys - y) <= reach) \
+            & (regions[window] == regions[x, y]) \
+            & (self.area.occupancy[window] == 0)
+        options = np.argwhere(nearby)
+
+        if len(options):
+            dx, dy = choice(options)
+            self.owner.set_loc(left + int(dx), top + int(dy))
+
     def make_decision(self):
 
         # Makes a choice - move or not
@@ -25,6 +25,8 @@ from ..utilities.constants import COLOURS as C
 class Player(Entity):
     """The player character."""
 
+    __slots__ = ()
+
     def __init__(self,
                  name="entity",
                  description="You",
@@ -92,10 +94,6 @@ class Player(Entity):
         elif isinstance(instruction, Evoke):
             self.evoke(instruction.ability, instruction.target)
 
-    def prepare(self):
-        """Increase readiness for action."""
-        self.readiness += self.body.speed
-
     def interpret_surge(self, instruction):
         """Interprets an action with a direction based on context."""
 
@@ -163,8 +161,12 @@ class Player(Entity):
         As this is the player, also ends the game."""
 
         # Replace the entity with a corpse
-        self.area.contents.remove(self)
-        self.area.contents.add(Corpse(self.name, self.x, self.y))
+        area = self.area
+        area.remove_contents(self)
+        area.add_contents(Corpse(self.name, self.x, self.y))
+
+        # Stay attached to the area so it can still be displayed
+        self.area = area
 
         # Log the death
         text = f"{self.phrase} die in agony.".capitalize()
@@ -4,12 +4,17 @@ This is a single in-game location.
 """
 
 from ..entities.entity import Entity
-from ..environments.tiles import basic_floor, unknown
+from ..environments.tiles import basic_floor, unknown, tile_appearance
 from .features import Feature
+from .scheduler import Scheduler, turns_taken
+from .layers import Layer
 from ..items.items import Item
 import numpy as np
 from tcod.map import compute_fov
-from ..utilities.constants import DIRECTIONS
+from ..utilities.constants import DIRECTIONS, FOV_CACHE_SIZE, \
+    RANGE_CACHE_SIZE, RenderOrder
+from collections import OrderedDict
+from bisect import insort
 import tcod
 
 
@@ -26,6 +31,39 @@ class Area:
         # Holders for all internal objects
         self.contents = set()
 
+        # Index of objects by tile, for fast location lookups
+        # Each tile's objects are kept in display order
+        self.locations = {}
+
+        # Objects split by render order, lowest first
+        self.layers = {order: Layer() for order in RenderOrder}
+
+        # Contents split by type (dicts keep insertion order)
+        self.typed_contents = {Entity: {}, Item: {}, Feature: {}}
+
+        # Count of blocking objects on each tile
+        self.occupancy = np.zeros((width, height), dtype=np.int16, order="F")
+
+        # Incremented whenever a blocking object arrives or leaves a tile
+        self.occupancy_revision = 0
+
+        # Entities grouped by faction
+        self.factions = {}
+
+        # Turn order for entities and features
+        self.scheduler = Scheduler()
+
+        # The world tick the area was last brought up to date on
+        self.last_simulated = world.ticks
+
+        # Distance maps to goals, shared by all entities for one turn
+        # (or until the tiles change)
+        self.distance_maps = {}
+        self.distance_maps_key = None
+
+        # The best step towards each goal from every tile
+        self.step_maps = {}
+
         # ---HACK--- #
 
         # Create a map of floor tiles, with x and y humanised.
@@ -43,28 +81,50 @@ class Area:
 
         # ---/HACK--- #
 
+        # Incremented whenever the tiles change
+        self.terrain_revision = 0
+
+        # Connected groups of passable tiles, with the revision they match
+        self.regions = None
+
+        # The composited appearance of every tile, built when first needed
+        self.appearance = None
+
+        # Recently calculated fields of view, oldest first
+        self.fov_cache = OrderedDict()
+
+        # Recently flood-filled ranges, oldest first
+        self.range_cache = OrderedDict()
+
+        # Symmetric fields of view let one entity's view answer whether
+        # others can see it
+        self.symmetric_fov = False
+
+        # Has the area changed since it was last saved?
+        self.dirty = True
+
     @property
     def entities(self):
-        """Returns a set of entities in the area."""
-        return set([thing for thing in self.contents
-                    if isinstance(thing, Entity)])
+        """Returns a read-only, set-like view of entities in the area."""
+        return self.typed_contents[Entity].keys()
 
     @property
     def items(self):
-        """Returns a set of items in the area."""
-        return set([thing for thing in self.contents
-                    if isinstance(thing, Item)])
+        """Returns a read-only, set-like view of items in the area."""
+        return self.typed_contents[Item].keys()
 
     @property
     def features(self):
-        """Returns a set of features in the area."""
-        return set([thing for thing in self.contents
-                    if isinstance(thing, Feature)])
+        """Returns a read-only, set-like view of features in the area."""
+        return self.typed_contents[Feature].keys()
+
+    def get_faction(self, faction):
+        """Returns a read-only, set-like view of a faction's entities."""
+        return self.factions.get(faction, {}).keys()
 
     def is_free(self, x, y):
         """Checks if a given tile is inbounds, passable, and unoccupied."""
-        return self.is_passable(x, y) and not self.get_blocker_at_location(x,
-                                                                           y)
+        return self.is_passable(x, y) and not self.occupancy[x, y]
 
     def is_visible(self, x, y):
         """Checks if a given point is visible."""
@@ -83,17 +143,9 @@ class Area:
         return 0 <= x < self.width and 0 <= y < self.height
 
     def at_location(self, x, y):
-        """Returns a set of objects at the given location."""
-        if self.in_bounds(x, y):
-            contents = set([thing for thing in self.contents
-                            if thing.x == x and thing.y == y])
-
-            return sorted(sorted(contents, key=lambda x: x.name),
-                        key=lambda x: x.render_order.value,
-                        reverse=True)
-        
-        # Return an empty list if outside bounds
-        return []
+        """Returns a list of objects at the given location, entities first
+        and then by name."""
+        return list(self.locations.get((x, y), []))
 
     def distance_between(self, a, b):
         """Gets the absolute difference between two tile locations."""
@@ -119,25 +171,48 @@ class Area:
     def get_tiles_in_range(self, x, y, range):
         """Returns the location of passable tiles that can be reached from a starting
            tile within a particular radius."""
+        xs, ys = np.nonzero(self.get_range_mask(x, y, range))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def get_range_mask(self, x, y, range):
+        """Returns a (read-only) map of the passable tiles that can be
+        reached from a starting tile without going as far as a radius
+        from it. The starting tile and its passable neighbours are always
+        included."""
+
+        key = (x, y, range, self.terrain_revision)
+
+        # Reuse a previous result if nothing has changed
+        if key in self.range_cache:
+            self.range_cache.move_to_end(key)
+            return self.range_cache[key]
+
+        # Only the tiles within the radius are searched
+        reach = max(range - 1, 1)
+        left, top = max(0, x - reach), max(0, y - reach)
+        window = (slice(left, min(self.width, x + reach + 1)),
+                  slice(top, min(self.height, y + reach + 1)))
+        xs, ys = np.ogrid[window]
+        cost = (self.tiles["passable"][window]
+                & (abs(xs - x) + abs(ys - y) <= reach)).astype(np.int8)
+
+        # Flood outwards from the start
+        distance = tcod.path.maxarray(cost.shape, order="F")
+        distance[x - left, y - top] = 0
+        tcod.path.dijkstra2d(distance, cost, cardinal=1, diagonal=None)
 
-        # Holder for valid tiles
-        tiles = [(x, y)]
+        reached = np.zeros((self.width, self.height), dtype=bool, order="F")
+        reached[window] = distance < np.iinfo(distance.dtype).max
 
-        # Tiles to explore
-        edge = self.get_directly_adjacent_tiles(x, y)
+        # Shared between callers, so protect it from changes
+        reached.flags.writeable = False
 
-        # BFS for tiles in range
-        while edge:
-            curr = edge.pop()
-            tiles.append(curr)
-            potentials = self.get_directly_adjacent_tiles(curr[0],
-                                                          curr[1])
-            for tile in potentials:
-                if tile not in edge and tile not in tiles:
-                    if self.distance_between((x, y), tile) < range:
-                        edge.append(tile)
+        # Remember the result, forgetting the oldest if full
+        self.range_cache[key] = reached
+        if len(self.range_cache) > RANGE_CACHE_SIZE:
+            self.range_cache.popitem(last=False)
 
-        return tiles
+        return reached
 
     def items_at_location(self, x, y):
         """Returns the set of pick-upable items at the location."""
@@ -147,27 +222,114 @@ class Area:
 
     def add_contents(self, addition):
         """Adds new objects to the level."""
-        if not isinstance(addition, list):
-            self.contents.add(addition)
-            addition.area = self
-        else:
-            self.contents = self.contents.union(set(addition))
-            for thing in addition:
-                thing.area = self
+        additions = addition if isinstance(addition, list) else [addition]
+        self.dirty = True
+
+        for thing in additions:
+            self.contents.add(thing)
+            self.index_location(thing)
+            self.index_type(thing)
+            self.layers[thing.render_order].add(thing)
+            thing.area = self
 
     def remove_contents(self, contents):
         """Removes objects from the level."""
-        if not isinstance(contents, list):
-            self.contents.remove(contents)
-            contents.area = None
-        else:
-            self.contents = self.contents.difference(set(contents))
-            for thing in contents:
-                thing.area = None
+        removals = contents if isinstance(contents, list) else [contents]
+        self.dirty = True
+
+        for thing in removals:
+            self.contents.remove(thing)
+            self.unindex_location(thing)
+            self.unindex_type(thing)
+            self.layers[thing.render_order].remove(thing)
+            thing.area = None
+
+    def move_contents(self, thing, x, y):
+        """Moves an object in the level to a new tile."""
+        self.unindex_location(thing)
+        thing.x = x
+        thing.y = y
+        self.index_location(thing)
+        self.layers[thing.render_order].move(thing)
+
+    def index_location(self, thing):
+        """Records an object against its current tile."""
+        insort(self.locations.setdefault((thing.x, thing.y), []), thing,
+               key=self.display_order)
+
+        if thing.blocks and self.in_bounds(thing.x, thing.y):
+            self.occupancy[thing.x, thing.y] += 1
+            self.occupancy_revision += 1
+
+    def unindex_location(self, thing):
+        """Removes an object from the record of its current tile."""
+        bucket = self.locations[(thing.x, thing.y)]
+        bucket.remove(thing)
+
+        if thing.blocks and self.in_bounds(thing.x, thing.y):
+            self.occupancy[thing.x, thing.y] -= 1
+            self.occupancy_revision += 1
+
+        # Drop empty tiles so the index only holds occupied ones
+        if not bucket:
+            del self.locations[(thing.x, thing.y)]
+
+    @staticmethod
+    def display_order(thing):
+        """Sort key putting the most prominent objects on a tile first."""
+        return (-thing.render_order.value, thing.name)
+
+    def index_type(self, thing):
+        """Records an object against the type collections it belongs to."""
+        for kind, group in self.typed_contents.items():
+            if isinstance(thing, kind):
+                group[thing] = None
+
+        if isinstance(thing, Entity):
+            self.factions.setdefault(thing.faction, {})[thing] = None
+            self.scheduler.add(thing, Scheduler.ENTITY)
+        elif isinstance(thing, Feature):
+            self.scheduler.add(thing, Scheduler.FEATURE)
+
+    def unindex_type(self, thing):
+        """Removes an object from the type collections."""
+        for group in self.typed_contents.values():
+            group.pop(thing, None)
+
+        if isinstance(thing, Entity):
+            self.factions.get(thing.faction, {}).pop(thing, None)
+
+        self.scheduler.remove(thing)
+
+    def rebuild_indexes(self, order=None):
+        """Recreates the lookup structures from the area contents, added
+        in the given order (by default, any order)."""
+        self.locations = {}
+        self.layers = {order: Layer() for order in RenderOrder}
+        self.typed_contents = {Entity: {}, Item: {}, Feature: {}}
+        self.factions = {}
+        self.scheduler = Scheduler()
+        self.occupancy = np.zeros((self.width, self.height),
+                                  dtype=np.int16, order="F")
+        self.occupancy_revision = 0
+        self.distance_maps = {}
+        self.distance_maps_key = None
+        self.step_maps = {}
+        self.regions = None
+        self.fov_cache = OrderedDict()
+        self.range_cache = OrderedDict()
+        for thing in self.contents if order is None else order:
+            self.index_location(thing)
+            self.index_type(thing)
+            self.layers[thing.render_order].add(thing)
 
     def get_blocker_at_location(self, x, y):
         """Returns the blocking entity at a particular position."""
 
+        # Skip the search if nothing on the tile blocks
+        if not self.in_bounds(x, y) or not self.occupancy[x, y]:
+            return None
+
         # Get all objects on the tile
         present = self.at_location(x, y)
 
@@ -175,6 +337,17 @@ class Area:
             if thing.blocks:
                 return thing
 
+    def get_movement_costs(self):
+        """Returns the cost of moving onto each tile; impassable tiles
+        cost 0 and occupied ones are discouraged."""
+
+        passable = self.tiles["passable"]
+
+        # Squares containing blockers have a higher cost
+        # - discourage routing through them
+        return np.where(passable & (self.occupancy > 0),
+                        11, passable).astype(np.int8)
+
     def get_interactable_feature_at_location(self, x, y):
         """Returns the feature in a particular tile."""
 
@@ -185,74 +358,407 @@ class Area:
             if isinstance(thing, Feature) and thing.interactable:
                 return thing
 
+    def set_tiles(self, x, y, tile):
+        """Changes the tile(s) at a location; x and y may be slices."""
+        self.tiles[x, y] = tile
+        self.terrain_revision += 1
+        self.dirty = True
+
+        if self.appearance is not None:
+            self.refresh_appearance((x, y))
+
     def calculate_fov(self, entity):
-        """Returns the visible area for a particular entity"""
+        """Returns the (read-only) visible area for a particular entity"""
+
+        algorithm = tcod.FOV_SYMMETRIC_SHADOWCAST if self.symmetric_fov \
+            else tcod.FOV_SHADOW
+        key = (entity.x, entity.y, entity.body.view_radius,
+               self.terrain_revision, algorithm)
 
-        # Get a map the size of the level
-        visible = np.full((self.width, self.height),
-                          fill_value=False,
-                          order="F")
+        # Reuse a previous result if nothing has changed
+        if key in self.fov_cache:
+            self.fov_cache.move_to_end(key)
+            return self.fov_cache[key]
 
         # Compute field of view from the entity's location
-        visible[:] = compute_fov(self.tiles["transparent"],
-                                 (entity.x, entity.y),
-                                 radius=entity.body.view_radius,
-                                 algorithm=tcod.FOV_SHADOW)
+        visible = np.asfortranarray(compute_fov(self.tiles["transparent"],
+                                                (entity.x, entity.y),
+                                                radius=key[2],
+                                                algorithm=algorithm))
+
+        # Shared between callers, so protect it from changes
+        visible.flags.writeable = False
+
+        # Remember the result, forgetting the oldest if full
+        self.fov_cache[key] = visible
+        if len(self.fov_cache) > FOV_CACHE_SIZE:
+            self.fov_cache.popitem(last=False)
 
         # Return the visible map
         return visible
 
+    def get_observers(self, target, candidates=None):
+        """Returns the set of entities (by default, all those in the area)
+        that can see the target."""
+
+        if candidates is None:
+            candidates = self.entities
+        candidates = [thing for thing in candidates if thing is not target]
+        xs = np.array([thing.x for thing in candidates], dtype=np.intp)
+        ys = np.array([thing.y for thing in candidates], dtype=np.intp)
+        reach = np.array([thing.body.view_radius
+                          for thing in candidates]) ** 2
+
+        if not candidates:
+            return set()
+
+        # Squared distances for every candidate at once
+        distance = (xs - target.x) ** 2 + (ys - target.y) ** 2
+
+        if self.symmetric_fov:
+
+            # Anyone the target can see can see the target
+            seen = self.calculate_fov(target)[xs, ys]
+            visible = seen & (distance < reach) \
+                & (distance < target.body.view_radius ** 2)
+
+            # Those who see further than the target fall back to a
+            # (slightly stricter) direct line check
+            for i in np.flatnonzero((distance < reach)
+                                    & (distance >= target.body.view_radius
+                                       ** 2)):
+                visible[i] = self.has_line_of_sight(candidates[i].loc,
+                                                    target.loc)
+
+        else:
+
+            # Only consult the field of view of candidates in range
+            visible = np.zeros(len(candidates), dtype=bool)
+            for i in np.flatnonzero(distance <= reach):
+                visible[i] = self.calculate_fov(candidates[i])[target.x,
+                                                               target.y]
+
+        return {candidates[i] for i in np.flatnonzero(visible)}
+
+    def can_see(self, observer, target):
+        """Checks if one entity can see another."""
+        return observer in self.get_observers(target, [observer])
+
+    def has_line_of_sight(self, start, end):
+        """Checks if nothing opaque lies on the direct path between
+        two points."""
+        path = self.get_direct_path_to(start, end)[1:-1]
+        return bool(self.tiles["transparent"][path[:, 0], path[:, 1]].all())
+
+    def get_targets_in_range(self, actor, range):
+        """Returns a map of the tiles within a range of an entity that it
+        can see, with nothing impassable on the direct path to them."""
+
+        x, y = actor.loc
+
+        # Visible tiles in range
+        xs, ys = np.ogrid[:self.width, :self.height]
+        targets = self.calculate_fov(actor) & (abs(xs - x) + abs(ys - y)
+                                               <= range)
+
+        # The offset to each, as columns
+        tx, ty = np.nonzero(targets)
+        dx, dy = (tx - x)[:, None], (ty - y)[:, None]
+        along_x = abs(dx) > abs(dy)
+        major = np.maximum(abs(dx), abs(dy))
+        minor = np.minimum(abs(dx), abs(dy))
+
+        # Steps along the longer axis, for the tiles between the ends
+        steps = np.arange(1, max(major.max(initial=0), 1))[None, :]
+        between = steps < major
+
+        # The matching steps along the shorter axis, as tcod's Bresenham
+        # lines take them
+        shifts = np.maximum(0, -((major - 2 * steps * minor)
+                                 // np.maximum(2 * major, 1)))
+
+        # Every tile between, with the ends of short lines padded out
+        px = np.where(between,
+                      x + np.sign(dx) * np.where(along_x, steps, shifts), x)
+        py = np.where(between,
+                      y + np.sign(dy) * np.where(along_x, shifts, steps), y)
+
+        clear = (self.tiles["passable"][px, py] | ~between).all(axis=1)
+        targets[tx[~clear], ty[~clear]] = False
+
+        return targets
+
     def get_tile_appearances(self):
         """Get the current appearance of each tile."""
-        return np.select(condlist=[self.visible_tiles,
-                                   self.explored_tiles],
-                         choicelist=[self.tiles["in_view"],
-                                     self.tiles["out_of_view"]],
-                         default=unknown)
+        if self.appearance is None:
+            self.refresh_appearance(...)
+        return self.appearance
+
+    def refresh_appearance(self, where):
+        """Recomposites the appearance of the given tiles."""
+
+        # Composite everything if there's nothing to update yet
+        if self.appearance is None:
+            self.appearance = np.empty((self.width, self.height),
+                                       dtype=tile_appearance, order="F")
+            where = ...
+
+        self.appearance[where] = np.select(
+            condlist=[self.visible_tiles[where],
+                      self.explored_tiles[where]],
+            choicelist=[self.tiles["in_view"][where],
+                        self.tiles["out_of_view"][where]],
+            default=unknown)
 
     def update_tile_states(self, entity):
         """Updates the state of tiles (visible/explored)
            based on a given entity."""
 
-        # Update the visible tiles based on the player's FoV
-        self.visible_tiles = self.calculate_fov(entity)
+        # Get the visible tiles based on the player's FoV
+        visible = self.calculate_fov(entity)
+
+        # Nothing to do if the view hasn't changed
+        if visible is self.visible_tiles:
+            return
+
+        # Only tiles entering or leaving view change appearance
+        changed = visible != self.visible_tiles
+        self.visible_tiles = visible
+        self.dirty = True
 
         # Update explored tiles based on the visible ones
         # Set explored to equal explored | visible (preserve any Trues in
         # either)
         self.explored_tiles |= self.visible_tiles
 
-    def get_path_to(self, actor, x, y):
-        """Finds a route to between an entity and a position."""
+        if self.appearance is not None:
+            self.refresh_appearance(changed)
 
-        # Get the cost map
-        cost = actor.get_tile_costs()
+    def pass_time(self, ticks, player=None):
+        """Lets the contents of the area act for a number of ticks;
+        the player, if given, is left to act separately."""
+        self.scheduler.run(ticks, skip=player)
+        self.dirty = True
 
-        # Convert the map to a graph (disallow diagonal movement)
-        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=0)
+    def catch_up(self, ticks, player=None):
+        """Roughly makes up for a number of ticks the area was left alone,
+        with each entity and feature catching up on all its missed turns
+        at once; the player, if given, is left out."""
 
-        # Make a pathfinder
-        finder = tcod.path.Pathfinder(graph)
-        finder.add_root((actor.x, actor.y))
+        if ticks <= 0:
+            return
 
-        # Find a path if possible
-        path = finder.path_to((x, y)).tolist()
+        # Readiness is worked out directly, so bring it up to date first
+        self.scheduler.synchronise()
 
-        # If movement is possible
-        if path:
-            # Return all the path except the starting point
-            return path[1:]
-        else:
-            # No path can be found
+        for priority, group in [(Scheduler.ENTITY, self.entities),
+                                (Scheduler.FEATURE, self.features)]:
+            for thing in list(group):
+
+                # Skip the player, and anything already gone
+                if thing is player or thing.area is not self:
+                    continue
+
+                # Count the turns missed as the scheduler would have run
+                # them, keeping any leftover readiness
+                speed = self.scheduler.get_speed(thing, priority)
+                turns, thing.readiness = turns_taken(ticks, thing.readiness,
+                                                     speed)
+
+                thing.catch_up(turns)
+
+                # Requeue with the new readiness
+                if thing.area is self:
+                    self.scheduler.add(thing, priority)
+
+        self.dirty = True
+
+    def get_distance_map(self, x, y):
+        """Returns the movement cost from a goal to every tile.
+        Maps are computed once per turn, with blockers where they were
+        when it was made, and shared between entities."""
+
+        # Discard the maps from previous turns, or older terrain
+        key = (self.world.turn, self.terrain_revision)
+        if self.distance_maps_key != key:
+            self.distance_maps = {}
+            self.step_maps = {}
+            self.distance_maps_key = key
+
+        if (x, y) not in self.distance_maps:
+
+            # Flood outwards from the goal (disallow diagonal movement)
+            distance = tcod.path.maxarray((self.width, self.height),
+                                          order="F")
+            distance[x, y] = 0
+            tcod.path.dijkstra2d(distance, self.get_movement_costs(),
+                                 cardinal=2, diagonal=None)
+
+            self.distance_maps[(x, y)] = distance
+
+        return self.distance_maps[(x, y)]
+
+    def get_regions(self):
+        """Returns a map numbering each connected group of passable tiles,
+        with -1 for impassable ones."""
+
+        if self.regions is None or self.regions[0] != self.terrain_revision:
+            passable = self.tiles["passable"]
+            cost = passable.astype(np.int8)
+            labels = np.full((self.width, self.height), -1, dtype=np.int32,
+                             order="F")
+
+            # Flood out from each passable tile not yet in a region
+            region = 0
+            unlabelled = np.argwhere(passable)
+            while len(unlabelled):
+                distance = tcod.path.maxarray((self.width, self.height),
+                                              order="F")
+                distance[tuple(unlabelled[0])] = 0
+                tcod.path.dijkstra2d(distance, cost, cardinal=1,
+                                     diagonal=None)
+
+                labels[distance < np.iinfo(distance.dtype).max] = region
+                region += 1
+                unlabelled = np.argwhere(passable & (labels < 0))
+
+            self.regions = (self.terrain_revision, labels)
+
+        return self.regions[1]
+
+    def get_step_map(self, x, y):
+        """Returns, for every tile, the index in DIRECTIONS of the step
+        towards a goal, or -1 where there is none. Maps are shared like
+        the distance maps they come from."""
+
+        distance = self.get_distance_map(x, y)
+
+        if (x, y) not in self.step_maps:
+
+            # Impassable and out of bounds tiles are never closer
+            never = np.iinfo(distance.dtype).max
+            padded = np.pad(np.where(self.tiles["passable"], distance, never),
+                            1, constant_values=never)
+
+            # Each tile's neighbours' distances, in the order of DIRECTIONS
+            neighbours = np.stack([
+                padded[1 + dx:self.width + 1 + dx,
+                       1 + dy:self.height + 1 + dy]
+                for dx, dy in DIRECTIONS.values()])
+
+            # The closest neighbour, first on ties, if it is any closer
+            steps = np.argmin(neighbours, axis=0).astype(np.int8)
+            closest = np.min(neighbours, axis=0)
+            steps[closest >= distance] = -1
+
+            self.step_maps[(x, y)] = steps
+
+        return self.step_maps[(x, y)]
+
+    def get_step_towards(self, actor, x, y):
+        """Finds the next step from an entity towards a position."""
+
+        # The tile neighbouring the entity that is closest to the goal
+        step = self.get_step_map(x, y)[actor.x, actor.y]
+
+        # No step if the goal can't be reached
+        if step < 0:
             return None
 
+        dx, dy = list(DIRECTIONS.values())[step]
+        best = (actor.x + dx, actor.y + dy)
+
+        # Blockers may have moved since the map was made; if the best
+        # step is now taken, use the next best free one that is still
+        # closer (the goal itself is always kept)
+        if best == (x, y) or self.is_free(*best):
+            return best
+
+        distance = self.get_distance_map(x, y)
+        free = [(distance[tile], tile)
+                for tile in self.get_directly_adjacent_tiles(*actor.loc)
+                if distance[tile] < distance[actor.loc]
+                and self.is_free(*tile)]
+        return min(free)[1] if free else best
+
     def get_direct_path_to(self, start, end):
         """Return the direct path from the start to the end."""
         """Line of sight."""
         return tcod.los.bresenham(start, end)
 
+    # Pickling - lookup structures are rebuilt rather than saved
+
+    def __getstate__(self):
+        # Scheduling is lazy, so bring readiness up to date first
+        self.scheduler.synchronise()
+
+        state = self.__dict__.copy()
+        del state["locations"]
+        del state["layers"]
+        del state["typed_contents"]
+        del state["factions"]
+        del state["scheduler"]
+        del state["occupancy"]
+        del state["occupancy_revision"]
+        del state["distance_maps"]
+        del state["distance_maps_key"]
+        del state["step_maps"]
+        del state["regions"]
+        del state["fov_cache"]
+        del state["range_cache"]
+        state["appearance"] = None
+
+        # Contents are kept in the order they were added, so they take
+        # turns in the same order when loaded
+        ordered = dict.fromkeys(self.entities)
+        ordered.update(dict.fromkeys(self.features))
+        ordered.update(dict.fromkeys(self.items))
+        ordered.update(dict.fromkeys(self.contents))
+        state["contents"] = list(ordered)
+        return state
+
+    def __setstate__(self, state):
+
+        # Areas saved before they kept track of time
+        self.last_simulated = 0
+        self.__dict__.update(state)
+
+        # Older saves hold contents as a set, in no particular order
+        order = self.contents
+        self.contents = set(order)
+        self.rebuild_indexes(order)
+
+    # Lazy loading - an unloaded area keeps only its id and how to load it
+
+    @property
+    def loaded(self):
+        """Is the area in memory?"""
+        return "loader" not in self.__dict__
+
+    def unload(self, world, area_id, loader, dirty=False):
+        """Empties the area; it will be filled by the loader when used.
+        Dirty marks it as differing from the saved game."""
+        self.__dict__.clear()
+        self.__dict__.update(world=world, area_id=area_id, dirty=dirty,
+                             loader=loader)
+
+    def load(self):
+        """Fills an unloaded area, keeping its record of unsaved changes."""
+        dirty = self.__dict__["dirty"]
+        self.__dict__.pop("loader")()
+        self.dirty = dirty
+
+    def __getattr__(self, name):
+        # Only reached for missing attributes; unloaded areas load on use
+        if "loader" not in self.__dict__:
+            raise AttributeError(name)
+        self.world.get_area(self.area_id)
+        return getattr(self, name)
+
     # Utility functions
 
     def post(self, message):
-        """Adds a message to the associated message log."""
-        self.world.engine.message_log.add(message)
+        """Adds a message to the associated message log; areas simulated
+        away from the game have none."""
+        if self.world.engine is not None:
+            self.world.engine.message_log.add(message)
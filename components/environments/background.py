@@ -0,0 +1,162 @@
+"""
+This file contains the implementation of the BackgroundSimulation class.
+Background simulation keeps the areas the player isn't in moving, by
+running them in worker processes every few turns and merging the
+results back in, using the same chunks as saved games.
+"""
+
+import io
+import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .area import Area
+from .scheduler import ticks_until_ready
+from ..utilities.saves import SaveStore
+from ..utilities.constants import BACKGROUND_INTERVAL
+
+
+class DetachedWorld:
+    """Stands in for the world while an area is simulated on its own."""
+
+    def __init__(self, turn):
+        self.turn = turn
+        self.engine = None
+
+
+class DetachedBody:
+    """Stands in for the player's body, with what others can see of it."""
+
+    def __init__(self, body):
+        self.view_radius = body.view_radius
+        self.speed = body.speed
+
+
+class DetachedPlayer:
+    """Stands in for the player while an area is simulated on its own,
+    so entities hunting the player still know where to look."""
+
+    def __init__(self, player):
+        self.name = player.name
+        self.x = player.x
+        self.y = player.y
+        self.faction = player.faction
+        self.body = DetachedBody(player.body)
+
+    @property
+    def loc(self):
+        return (self.x, self.y)
+
+
+def advance_area(chunk, area_id, area_ids, player, turn, ticks, seed):
+    """Lets an area act for a number of ticks, then returns its new
+    chunk. Runs in a worker process."""
+
+    # Each area draws on its own stream of random numbers
+    random.seed(seed)
+
+    # Anything else outside the area is a placeholder, restored when
+    # merged
+    area = Area.__new__(Area)
+    world = DetachedWorld(turn)
+    objects = {("area", other): object() for other in area_ids}
+    objects.update({("area", area_id): area,
+                    ("world",): world,
+                    ("player",): player,
+                    ("engine",): None})
+
+    saves = SaveStore(None)
+    saves.restore_area(area, area_id, io.BytesIO(chunk), objects)
+
+    # Time passes a player turn at a time, as it does in play
+    turn_ticks = ticks_until_ready(0, player.body.speed)
+    while ticks > 0:
+        area.pass_time(min(ticks, turn_ticks))
+        ticks -= turn_ticks
+        world.turn += 1
+
+    references = {id(thing): key for key, thing in objects.items()
+                  if thing is not None}
+    return saves.snapshot_area(area, references, {})
+
+
+class BackgroundSimulation:
+    """Advances the areas the player isn't in, in worker processes."""
+
+    def __init__(self, interval=BACKGROUND_INTERVAL):
+
+        # Player turns between updates
+        self.interval = interval
+
+        # Updates in progress, with the tick they run to, by area id
+        self.pending = {}
+
+        # Worker processes and chunk pickling, started when first needed
+        self.pool = None
+        self.saves = SaveStore(None)
+
+    def update(self, world):
+        """Merges any finished updates; every few turns, starts the next."""
+
+        self.collect(world)
+        if world.turn % self.interval == 0:
+            self.start(world)
+
+    def start(self, world):
+        """Sends every other loaded area off to catch up to the world;
+        areas still being updated are left until their update is in."""
+
+        self.collect(world)
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn"))
+
+        references = self.saves.references(world)
+        references[id(world)] = ("world",)
+        references[id(world.player)] = ("player",)
+        area_ids = [area.area_id for area in world.areas]
+        player = DetachedPlayer(world.player)
+
+        # Unloaded areas are left for when they are next used
+        for area in world.areas:
+            if area.area_id == world.current_area or not area.loaded \
+                    or area.area_id in self.pending:
+                continue
+
+            start = area.last_simulated
+            if start >= world.ticks:
+                continue
+
+            chunk = self.saves.snapshot_area(area, references, {})
+            seed = f"{area.area_id}:{world.ticks}"
+            future = self.pool.submit(advance_area, chunk, area.area_id,
+                                      area_ids, player, world.turn,
+                                      world.ticks - start, seed)
+            self.pending[area.area_id] = (future, world.ticks)
+
+    def collect(self, world, area_id=None, wait=False):
+        """Merges finished updates (or just one area's) back into the
+        world, waiting for unfinished ones if told to."""
+
+        for pending_id, (future, tick) in list(self.pending.items()):
+            if area_id is not None and pending_id != area_id:
+                continue
+            if not wait and not future.done():
+                continue
+
+            del self.pending[pending_id]
+            area = world.areas[pending_id]
+            self.saves.restore_area(
+                area, pending_id, io.BytesIO(future.result()),
+                self.saves.objects(world.areas_by_id(), world))
+            area.dirty = True
+            area.last_simulated = tick
+
+    # Pickling - updates in progress are abandoned
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["pending"] = {}
+        state["pool"] = None
+        return state
@@ -10,6 +10,8 @@ from ..utilities.messages import CombatMessage
 class Feature(Object):
     """An independent, non-sentient object."""
 
+    __slots__ = ("interactable", "readiness", "update_speed", "mappable")
+
     def __init__(self, name="feature", description="An object in the world",
                  x=0, y=0, char="£", colour=C["TEMP"], blocks=False,
                  interactable=True, area=None, update_speed=10, mappable=False):
@@ -32,6 +34,10 @@ class Feature(Object):
         """Change state in response to time."""
         pass
 
+    def catch_up(self, updates):
+        """Makes up for a number of missed updates at once."""
+        pass
+
     def check_update(self):
         """Runs updates regularly"""
         if self.readiness >= 100:
@@ -44,6 +50,8 @@ class Feature(Object):
 class MappedFeature(Feature):
     """A feature that appears on the map once discovered."""
 
+    __slots__ = ("discovered",)
+
     def __init__(self, name="mapped feature",
                  description="An object worth remembering.",
                  x=0, y=0, char="_", colour=C["TEMP"],
@@ -57,6 +65,8 @@ class MappedFeature(Feature):
 class TemporaryFeature(Feature):
     """A feature with an expiry date."""
 
+    __slots__ = ("duration",)
+
     def __init__(self, name="temporary feature",
                  description="A temporary object in the world.",
                  x=0, y=0, char="_", colour=C["TEMP"], blocks=False,
@@ -72,10 +82,18 @@ class TemporaryFeature(Feature):
         if self.duration <= 0:
             self.destroy()
 
+    def catch_up(self, updates):
+        """Counts down several turns at once."""
+        self.duration -= updates
+        if self.duration <= 0:
+            self.destroy()
+
 
 class Stairs(MappedFeature):
     """A path between areas of the dungeon."""
 
+    __slots__ = ("target",)
+
     def __init__(self, x, y, area, target):
         self.target = target
 
@@ -96,6 +114,8 @@ class Stairs(MappedFeature):
 class AcidBlob(TemporaryFeature):
     """A blob of corrosive acid."""
 
+    __slots__ = ("damage",)
+
     def __init__(self, x=0, y=0, damage=3, duration=3, area=None,
                  update_speed=10):
         super().__init__("acid blob", "a blob of corrosive acid",
@@ -129,3 +149,12 @@ class AcidBlob(TemporaryFeature):
         self.act()
 
         super().update()
+
+    def catch_up(self, updates):
+        """Burns whatever is on it once, then counts down."""
+
+        if updates:
+            self.act()
+
+        if self.area:
+            super().catch_up(updates)
@@ -0,0 +1,61 @@
+"""
+This file contains the implementation of the Layer class.
+A layer holds all the objects in an area with the same render order,
+with their positions packed into arrays for quick filtering.
+"""
+
+import numpy as np
+
+
+class Layer:
+    """Objects of one render order and their packed positions."""
+
+    def __init__(self):
+        self.objects = []
+
+        # Each object's position in the list and in the arrays
+        self.slots = {}
+
+        # Packed positions, grown as needed
+        self.xs = np.zeros(16, dtype=np.intp)
+        self.ys = np.zeros(16, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def add(self, thing):
+        """Adds an object to the end of the layer."""
+
+        slot = len(self.objects)
+
+        # Double the arrays when they run out of room
+        if slot >= len(self.xs):
+            self.xs = np.resize(self.xs, slot * 2)
+            self.ys = np.resize(self.ys, slot * 2)
+
+        self.objects.append(thing)
+        self.slots[thing] = slot
+        self.xs[slot], self.ys[slot] = thing.x, thing.y
+
+    def remove(self, thing):
+        """Removes an object, filling its slot with the last object."""
+
+        slot = self.slots.pop(thing)
+        last = self.objects.pop()
+
+        if last is not thing:
+            self.objects[slot] = last
+            self.slots[last] = slot
+            self.xs[slot] = self.xs[len(self.objects)]
+            self.ys[slot] = self.ys[len(self.objects)]
+
+    def move(self, thing):
+        """Records an object's new position."""
+        slot = self.slots[thing]
+        self.xs[slot], self.ys[slot] = thing.x, thing.y
+
+    def select(self, mask):
+        """Returns the objects standing on tiles where the mask is True."""
+        count = len(self.objects)
+        hits = np.flatnonzero(mask[self.xs[:count], self.ys[:count]])
+        return [self.objects[i] for i in hits]
@@ -0,0 +1,150 @@
+"""
+This file contains the implementation of the Scheduler class.
+A scheduler works out when each entity and feature in an area
+will next act, so time can skip straight to it.
+"""
+
+from heapq import heappush, heappop
+from math import ceil
+
+
+def ticks_until_ready(readiness, speed):
+    """Returns how many ticks of preparation are needed to reach
+    full readiness."""
+    return max(0, ceil((100 - readiness) / speed))
+
+
+def turns_taken(ticks, readiness, speed):
+    """Returns how many turns an actor takes in a number of ticks, acting
+    on the tick after it is ready as the scheduler has it, and the
+    readiness it is left with."""
+
+    # Actors that never prepare only use up the readiness they have
+    if speed <= 0:
+        turns = min(ticks, readiness // 100)
+        return turns, readiness - turns * 100
+
+    # Each turn needs 100 readiness, gained on every tick not spent acting
+    turns = min(ticks, (ticks * speed + readiness) // (100 + speed))
+    return turns, readiness + (ticks - turns) * speed - turns * 100
+
+
+class Scheduler:
+    """A queue of actors, ordered by the tick they next act on."""
+
+    # Within a tick, entities act before features
+    ENTITY = 0
+    FEATURE = 1
+
+    def __init__(self):
+
+        # The last tick that has been fully processed
+        self.tick = 0
+
+        # The tick currently being processed
+        self.now = 0
+
+        # Heap of (due tick, priority, order, counter, scheduled tick, actor)
+        self.queue = []
+
+        # The counter of each actor's live queue entry
+        self.entries = {}
+        self.counter = 0
+
+        # Actors due on the same tick act in the order they were added
+        self.order = {}
+
+    def add(self, actor, priority):
+        """Queues an actor to act once it is ready."""
+
+        speed = self.get_speed(actor, priority)
+
+        # Actors that never prepare never act
+        if actor.readiness < 100 and speed <= 0:
+            self.entries.pop(actor, None)
+            return
+
+        # Prepare for the necessary ticks, then act on the one after
+        due = self.now + ticks_until_ready(actor.readiness, speed) + 1
+
+        self.counter += 1
+        self.entries[actor] = self.counter
+        order = self.order.setdefault(actor, self.counter)
+        heappush(self.queue,
+                 (due, priority, order, self.counter, self.now, actor))
+
+    def remove(self, actor):
+        """Stops an actor acting; its queue entry is ignored from now on."""
+        self.entries.pop(actor, None)
+        self.order.pop(actor, None)
+
+    def unqueue(self, actor, priority):
+        """Takes an actor out of the queue, with its readiness brought up
+        to date, so it can be added again once its speed has changed.
+        Returns whether it was queued."""
+
+        counter = self.entries.pop(actor, None)
+        if counter is None:
+            return False
+
+        # Actors in the middle of acting are already up to date
+        for due, _, order, queued, scheduled, _ in self.queue:
+            if queued == counter:
+                actor.readiness += (self.now - scheduled) \
+                    * self.get_speed(actor, priority)
+                break
+
+        return True
+
+    def get_speed(self, actor, priority):
+        """Returns how much readiness an actor gains each tick."""
+        if priority == self.ENTITY:
+            return actor.body.speed
+        return actor.update_speed
+
+    def run(self, ticks, skip=None):
+        """Processes a number of ticks, letting actors act when due."""
+
+        end = self.tick + ticks
+
+        while self.queue and self.queue[0][0] <= end:
+            due, priority, order, counter, scheduled, actor = \
+                heappop(self.queue)
+
+            # Ignore entries for removed or rescheduled actors
+            if self.entries.get(actor) != counter:
+                continue
+
+            # The skipped actor (the player) acts separately
+            if actor is skip:
+                self.remove(actor)
+                continue
+
+            self.now = due
+
+            # Catch up on the preparation done while waiting
+            actor.readiness += (due - scheduled - 1) \
+                * self.get_speed(actor, priority)
+
+            # Act, then wait for the next turn
+            if priority == self.ENTITY:
+                actor.consider_action()
+            else:
+                actor.check_update()
+
+            # Requeue, unless the action removed the actor
+            if self.entries.get(actor) == counter:
+                self.add(actor, priority)
+
+        self.tick = self.now = end
+
+    def synchronise(self):
+        """Brings the readiness of every queued actor up to date."""
+
+        for i, (due, priority, order, counter, scheduled, actor) \
+                in enumerate(self.queue):
+            if self.entries.get(actor) == counter:
+                actor.readiness += (self.tick - scheduled) \
+                    * self.get_speed(actor, priority)
+                self.queue[i] = (due, priority, order, counter, self.tick,
+                                 actor)
@@ -1,9 +1,19 @@
 """
 This class contains the implementation of the World class.
 A World contains information about several levels and the
-connections between them.
+connections between them. Only the most recently used areas
+are kept in memory; the rest wait on disk until they are needed.
+Optionally, areas the player isn't in keep moving in the background.
 """
 
+from collections import OrderedDict
+from functools import partial
+from tempfile import TemporaryDirectory
+from .scheduler import ticks_until_ready
+from .background import BackgroundSimulation
+from ..utilities.saves import SaveStore
+from ..utilities.constants import RESIDENT_AREAS, BACKGROUND_AREAS
+
 
 class World:
     """Manages the in-game environments."""
@@ -15,16 +25,157 @@ class World:
         self.current_area = 0
         self.areas = []
 
+        # Number of player turns taken, and of ticks passed
+        self.turn = 0
+        self.ticks = 0
+
+        # Most areas that can be in memory at once
+        self.resident_cap = RESIDENT_AREAS
+
+        # Ids of areas in use, least recently used first
+        self.recent = OrderedDict()
+
+        # The saved game the areas were last loaded from or saved to
+        self.saves = None
+
+        # Storage for unloaded areas with unsaved changes
+        self.swap = None
+        self.swap_directory = None
+
+        # Simulation of the other areas, if they aren't frozen
+        self.background = BackgroundSimulation() if BACKGROUND_AREAS \
+            else None
+
     @property
     def area(self):
         """Returns the currently-occupied area."""
-        return self.areas[self.current_area]
+        return self.get_area(self.current_area)
 
     @property
     def entities(self):
         """Returns the entities in the currently-occupied area."""
-        return self.areas[self.current_area].entities
+        return self.area.entities
+
+    def get_area(self, area_id):
+        """Returns an area, loading it if needed."""
+
+        area = self.areas[area_id]
+
+        self.recent[area_id] = None
+        self.recent.move_to_end(area_id)
+
+        if not area.loaded:
+            area.load()
+            self.evict(area_id)
+
+        return area
 
     def change_area(self, area_id):
         """Changes the current active area."""
+
+        # The area being left stops being simulated in full
+        self.area.last_simulated = self.ticks
+
+        # Bring in any changes made to the new area in the background
+        if self.background is not None:
+            self.background.collect(self, area_id, wait=True)
+
         self.current_area = area_id
+        area = self.get_area(area_id)
+        self.evict(area_id)
+
+        # Then make up for the rest of the time it was left alone
+        area.catch_up(self.ticks - area.last_simulated, self.player)
+
+    def evict(self, keep):
+        """Unloads the least recently used areas until no more than the
+        resident cap are loaded; the current area and keep stay."""
+
+        loaded = [area for area in self.areas if area.loaded]
+        if len(loaded) <= self.resident_cap:
+            return
+
+        # Areas never used count as the least recent
+        order = {area_id: i for i, area_id in enumerate(self.recent)}
+        candidates = sorted((area for area in loaded
+                             if area.area_id not in (keep, self.current_area)),
+                            key=lambda area: order.get(area.area_id, -1))
+
+        for area in candidates[:len(loaded) - self.resident_cap]:
+            self.unload(area)
+
+    def unload(self, area):
+        """Moves an area out of memory."""
+
+        self.recent.pop(area.area_id, None)
+        area_id = area.area_id
+
+        # Changes being made elsewhere are kept
+        if self.background is not None:
+            self.background.collect(self, area_id, wait=True)
+
+        # Unchanged areas can be read back from the saved game
+        if not area.dirty and self.saves is not None:
+            saves = self.saves
+            area.unload(self, area_id,
+                        partial(saves.load_area, area, area_id,
+                                saves.objects(self.areas_by_id(), self)))
+            return
+
+        if self.swap is None:
+            self.swap_directory = TemporaryDirectory(prefix="meld-")
+            self.swap = SaveStore(self.swap_directory.name, "none")
+
+        self.swap.save_area(area)
+        area.unload(self, area_id,
+                    partial(self.swap.load_area, area, area_id,
+                            self.swap.objects(self.areas_by_id(), self)),
+                    dirty=True)
+
+    def areas_by_id(self):
+        return {area.area_id: area for area in self.areas}
+
+    # Pickling - memory management starts afresh when loaded
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["recent"] = OrderedDict()
+        state["saves"] = None
+        state["swap"] = None
+        state["swap_directory"] = None
+        return state
+
+    def __setstate__(self, state):
+        # Worlds saved before the clock and background simulation
+        self.ticks = 0
+        self.background = None
+        self.saves = None
+        self.__dict__.update(state)
+
+    def pass_turn(self):
+        """Ends the player's turn; everything else in the current area
+        acts until the player is ready again."""
+
+        # Update the player state
+        self.player.readiness -= 100
+        self.player.update()
+        self.turn += 1
+
+        # Let all other entities and features act until the player
+        # is ready again
+        speed = self.player.body.speed
+        ticks = ticks_until_ready(self.player.readiness, speed)
+        self.player.readiness += ticks * speed
+        self.area.pass_time(ticks, self.player)
+        self.ticks += ticks
+
+        # Other areas catch up every few turns
+        if self.background is not None:
+            self.background.update(self)
+
+        # If a feature is visible and mappable, mark it as discovered.
+        self.area.update_tile_states(self.player)
+        for feature in self.area.features:
+            if hasattr(feature, "discovered") and not feature.discovered:
+                if self.area.is_visible(feature.x, feature.y):
+                    feature.discovered = True
@@ -11,6 +11,8 @@ from ..utilities.messages import CombatMessage, AlertMessage
 class Bandage(Consumable):
     """A one-use healing item."""
 
+    __slots__ = ("health",)
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__("Bandage",
                          "A tattered scrap of cloth to bind a wound.",
@@ -37,6 +39,8 @@ class Bandage(Consumable):
 class StrangeMoss(Consumable):
     """A single-use health boost"""
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__(name="Moss lump",
                          description="A lump of edible moss.",
@@ -59,6 +63,8 @@ class StrangeMoss(Consumable):
 class AcidFlask(Consumable):
     """A container of strong acid."""
 
+    __slots__ = ("impact_radius",)
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__("Acid flask",
                          "A stoppered flask of powerful acid.", "drink",
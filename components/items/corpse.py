@@ -6,6 +6,7 @@ from ..utilities.exceptions import Impossible
 from ..utilities.messages import AlertMessage
 
 class Corpse(Consumable):
+    __slots__ = ("health", "affinities")
 
     def __init__(self, name="body", x=0, y=0, area=None, health=2, affinities={}):
         super().__init__(name="Corpse", 
@@ -12,6 +12,8 @@ from random import random
 class Cudgel(Weapon):
     """A simple wooden club."""
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__("Cudgel",
                          "A short, weighty club.",
@@ -23,6 +25,8 @@ class Cudgel(Weapon):
 class VenomDagger(Weapon):
     """A curved dagger dipped in strange oils."""
 
+    __slots__ = ("poison_chance", "poison_damage", "poison_duration")
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__("Venom dagger",
                          "A curved dagger dipped in venom",
@@ -55,6 +59,8 @@ class VenomDagger(Weapon):
 class Robe(Armour):
     """A woollen robe."""
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, area=None):
         super().__init__("Robe",
                          "A scratchy wool robe.",
@@ -9,6 +9,8 @@ from ..utilities.messages import CombatMessage
 class Item(Object):
     """A basic item."""
 
+    __slots__ = ()
+
     def __init__(self, name, description, x=0, y=0,
                  char="€", colour=C["TEMP"], blocks=False, area=None):
         super().__init__(name, description, x, y, char, colour, blocks,
@@ -28,6 +30,8 @@ class Item(Object):
 class Equippable(Item):
     """An equippable item."""
 
+    __slots__ = ("equipped",)
+
     def __init__(self, name, description, x=0, y=0,
                  char="/", colour=C["TEMP"], area=None):
         super().__init__(name, description, x, y,
@@ -38,6 +42,8 @@ class Equippable(Item):
 class Weapon(Equippable):
     """An equippable weapon."""
 
+    __slots__ = ("damage", "verb")
+
     def __init__(self, name, description, damage, x=0, y=0,
                  char="/", colour=C["TEMP"], verb="strike", area=None):
         super().__init__(name, description, x, y,
@@ -67,6 +73,8 @@ class Weapon(Equippable):
 class Armour(Equippable):
     """An equippable clothing item."""
 
+    __slots__ = ()
+
     def __init__(self, name, description, x=0, y=0,
                  char="/", colour=C["TEMP"], area=None):
         super().__init__(name, description, x, y,
@@ -76,6 +84,8 @@ class Armour(Equippable):
 class Consumable(Item):
     """An item that is consumed on use."""
 
+    __slots__ = ("uses", "verb")
+
     def __init__(self, name, description, verb="use", uses=1, x=0, y=0,
                  char="!", colour=C["TEMP"], area=None):
         super().__init__(name, description, x, y, char, colour, area)
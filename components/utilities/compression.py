@@ -0,0 +1,98 @@
+"""
+This file contains the compression codecs available for save files.
+Compressed data starts with a small header naming the codec and level,
+so it can be read back without knowing how it was written.
+"""
+
+import bz2
+import lzma
+import struct
+import zlib
+
+# Optional codecs, used only if installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+
+# Marks data that starts with a codec header
+MAGIC = b"MELD"
+
+
+class Codec:
+    """A named compression method with a default level."""
+
+    def __init__(self, name, compress, decompress, level):
+        self.name = name
+        self.compress = compress
+        self.decompress = decompress
+        self.level = level
+
+
+codecs = {
+    "none": Codec("none",
+                  lambda data, level: data,
+                  lambda data: data, 0),
+    "zlib": Codec("zlib",
+                  lambda data, level: zlib.compress(data, level),
+                  zlib.decompress, 6),
+    "bz2": Codec("bz2",
+                 lambda data, level: bz2.compress(data, level),
+                 bz2.decompress, 9),
+    "lzma": Codec("lzma",
+                  lambda data, level: lzma.compress(data, preset=level),
+                  lzma.decompress, 6)
+}
+
+if zstandard is not None:
+    codecs["zstd"] = Codec(
+        "zstd",
+        lambda data, level:
+            zstandard.ZstdCompressor(level=level).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data), 3)
+
+if lz4 is not None:
+    codecs["lz4"] = Codec(
+        "lz4",
+        lambda data, level:
+            lz4.frame.compress(data, compression_level=level),
+        lz4.frame.decompress, 0)
+
+# Prefer whichever installed codec is quickest to read back
+DEFAULT_CODEC = "zstd" if "zstd" in codecs else "zlib"
+
+
+def compress(data, codec=DEFAULT_CODEC, level=None):
+    """Compresses data, prefixed with a header naming the codec."""
+
+    codec = codecs[codec]
+    level = codec.level if level is None else level
+
+    # The level is signed, as zstd's fast levels are negative
+    name = codec.name.encode()
+    header = MAGIC + bytes([len(name)]) + name + struct.pack("b", level)
+    return header + codec.compress(data, level)
+
+
+def decompress(data):
+    """Decompresses data, using the codec named in its header."""
+
+    # Saves from before codec headers were always lzma
+    if not data.startswith(MAGIC):
+        return lzma.decompress(data)
+
+    start = len(MAGIC) + 1
+    end = start + data[len(MAGIC)]
+    name = data[start:end].decode()
+
+    if name not in codecs:
+        raise ValueError(f"Save data uses the unavailable codec '{name}'")
+
+    # Skip the (signed) level byte too
+    return codecs[name].decompress(data[end + 1:])
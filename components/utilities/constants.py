@@ -10,6 +10,27 @@ DIRECTIONS = {
     "DOWN": (0, 1)
 }
 
+# Number of field of view results each area remembers
+FOV_CACHE_SIZE = 1024
+
+# Number of flood-filled ranges each area remembers
+RANGE_CACHE_SIZE = 64
+
+# Number of player turns between autosaves
+AUTOSAVE_INTERVAL = 50
+
+# Keep saved tile layers in memory-mapped files, for very large worlds
+MAPPED_TILES = False
+
+# Most areas kept in memory at once; the rest are loaded when needed
+RESIDENT_AREAS = 3
+
+# Keep areas the player isn't in moving, in other processes
+BACKGROUND_AREAS = False
+
+# Number of player turns between background updates of other areas
+BACKGROUND_INTERVAL = 25
+
 COLOURS = {
     "RED": tcod.red,
     "WHITE": tcod.white,
@@ -23,6 +44,7 @@ COLOURS = {
     "PATH": (179, 102, 255),
     "RADIUS": (140, 26, 255),
     "TARGET": (102, 0, 204),
+    "RANGE": (77, 0, 153),
     "TEMP": tcod.chartreuse
 }
 
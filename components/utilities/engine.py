@@ -8,9 +8,8 @@ import tcod
 from .states.main_menu_state import MainMenu
 from .states.game_over_state import GameOver
 from .messages import WorldMessage, MessageLog
-import pickle
-import lzma
-from os import remove, path
+from .saves import SaveStore
+from .constants import MAPPED_TILES
 
 # -- HACK -- #
 
@@ -43,15 +42,15 @@ class Engine:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.font = font
-        self.tileset = tcod.tileset.load_tilesheet("./assets/arial12x12.png",
-                                                   32, 8,
-                                                   tcod.tileset.CHARMAP_TCOD)
 
         # Drawing console
         # Order=F flips x and y, for easier drawing
         self.console = tcod.Console(self.screen_width, self.screen_height,
                                     order="F")
 
+        # The saved game
+        self.saves = SaveStore("./savegame", mapped=MAPPED_TILES)
+
         # Starting state
         self.state = MainMenu(self)
 
@@ -78,33 +77,27 @@ class Engine:
         """Saves the current state of the game world and
         then switches to the main menu."""
 
-        # Unhook the world from the engine
-        self.world.engine = None
-
-        # Pickle and compress the data
-        data = lzma.compress(pickle.dumps(self.world))
-
-        # Write the data to the savefile
-        with open("savefile.sav", "wb") as file:
-            file.write(data)
+        # Write the world header and any changed areas
+        self.saves.save(self.world)
 
         # Go back to the menu
         self.set_state(MainMenu(self))
 
+    def autosave(self):
+        """Saves the game without leaving play, writing it in the
+        background."""
+        self.saves.write_in_background(self.world)
+
     def load_game(self):
         """Load a game from a file and then switches the state to playing."""
 
         # Clean up after any previous game
         self.clean_up()
 
-        # Open the save file
-        with open("savefile.sav", "rb") as file:
-
-            # Load the data
-            data = pickle.loads(lzma.decompress(file.read()))
+        # Load the world and its areas
+        self.world = self.saves.load()
 
         # Hook it all back up together
-        self.world = data
         self.world.engine = self
 
         # Resume playing
@@ -113,9 +106,8 @@ class Engine:
     def game_over(self):
         """Ends the game."""
 
-        # Wipe the save file - this is permadeath.
-        if path.exists('.savefile.sav'):
-            remove('./savefile.sav')
+        # Wipe the saved game - this is permadeath.
+        self.saves.delete()
 
         self.state = GameOver(self, self.state)
 
@@ -128,9 +120,12 @@ class Engine:
 
         # Make the window
         """Creates the main window and begins the game loop."""
+        tileset = tcod.tileset.load_tilesheet(self.font, 32, 8,
+                                              tcod.tileset.CHARMAP_TCOD)
+
         with tcod.context.new_terminal(self.screen_width,
                                        self.screen_height,
-                                       tileset=self.tileset,
+                                       tileset=tileset,
                                        title=self.screen_title) as window:
 
             # Flag for the game running
@@ -157,7 +152,7 @@ class Engine:
         area = Area(80, 50, world, "surface")
         area2 = Area(80, 50, world, "caverns", 1)
         player = Player("You", "A person", 5, 5)
-        player.body.mouth = AcidSpittingMouth()
+        player.body.attach(AcidSpittingMouth)
         player.body.owner = player
         world.player = player
         other = Entity("other", "Not you.", 10, 10, mind=Wanderer)
@@ -165,7 +160,7 @@ class Engine:
         A, B, C = Corpse("A", 1, 1), Corpse("B", 1, 1), Corpse("C", 2, 2)
         D, E, F = Bandage(3, 3), Cudgel(4, 4), Robe(6, 6)
         G, H = AcidFlask(7, 7), StrangeMoss(7, 7)
-        area.tiles[30:33, 22] = basic_wall
+        area.set_tiles(slice(30, 33), 22, basic_wall)
         self.message_log.add(WorldMessage("Your journey begins."
                                           "You are unlikely to survive"))
         world.areas.append(area)
@@ -5,11 +5,14 @@ classes.
 
 from textwrap import wrap
 from .constants import COLOURS as C
+from .slotted import Slotted
 
 
-class Message:
+class Message(Slotted):
     """A single in-game message."""
 
+    __slots__ = ("text", "colour", "count")
+
     def __init__(self, text, colour=C["WHITE"]):
         self.text = text
         self.colour = colour
@@ -28,36 +31,54 @@ class Message:
 
 class CombatMessage(Message):
     """A violent act."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["RED"])
 
 
 class SystemMessage(Message):
     """An error or exception."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["YELLOW"])
 
 
 class WorldMessage(Message):
     """A global event."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["PURPLE"])
 
 
 class ItemMessage(Message):
     """An item changes hands or state."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["BROWN"])
 
 
 class AlertMessage(Message):
     """A sudden and shocking change."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["GREEN"])
 
 
 class DeathMessage(Message):
     """The brutal end of a short life."""
+
+    __slots__ = ()
+
     def __init__(self, text):
         super().__init__(text, C["GREY"])
 
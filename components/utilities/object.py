@@ -5,9 +5,12 @@ world.
 """
 
 from .constants import COLOURS as C, RenderOrder
+from .slotted import Slotted
 
 
-class Object:
+class Object(Slotted):
+    __slots__ = ("name", "description", "x", "y", "char", "colour", "blocks",
+                 "area", "render_order")
 
     def __init__(self,
                  name="thing",
@@ -39,8 +42,7 @@ class Object:
     def set_loc(self, x, y):
         """Sets the object location."""
         if self.area.in_bounds(x, y):
-            self.x = x
-            self.y = y
+            self.area.move_contents(self, x, y)
 
     @property
     def description_text(self):
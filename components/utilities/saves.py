@@ -0,0 +1,357 @@
+"""
+This file contains the implementation of the SaveStore class.
+A save store keeps a game on disk as a small world header and one
+chunk per area, so saving only rewrites the areas that have changed.
+Saves can be compressed and written on a background thread while play
+continues (the world is still pickled first, on the game thread), and
+tile layers can be kept in memory-mapped files.
+"""
+
+import io
+import os
+import pickle
+import shutil
+from uuid import uuid4
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from .compression import compress, decompress, DEFAULT_CODEC
+from ..environments.area import Area
+
+
+class ChunkPickler(pickle.Pickler):
+    """Pickles one part of the world, storing only references to
+    objects that are saved elsewhere."""
+
+    def __init__(self, file, references):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+
+        # Keys for shared objects, by id
+        self.references = references
+
+    def persistent_id(self, obj):
+        return self.references.get(id(obj))
+
+
+class ChunkUnpickler(pickle.Unpickler):
+    """Unpickles one part of the world, resolving its references."""
+
+    def __init__(self, file, objects):
+        super().__init__(file)
+
+        # Shared objects, by key
+        self.objects = objects
+
+    def persistent_load(self, key):
+        return self.objects[key]
+
+
+class SaveStore:
+    """A saved game, stored as a directory of chunks."""
+
+    def __init__(self, directory, codec=DEFAULT_CODEC, level=None,
+                 mapped=False):
+        self.directory = directory
+
+        # How files are compressed; the level defaults to the codec's own
+        self.codec = codec
+        self.level = level
+
+        # Store tile layers as raw files, mapped into memory when loaded
+        self.mapped = mapped
+
+        # Background writer, started when first needed
+        self.writer = None
+        self.pending = None
+
+    @property
+    def header_path(self):
+        return os.path.join(self.directory, "world.sav")
+
+    def chunk_path(self, area_id):
+        return os.path.join(self.directory, f"area_{area_id}.sav")
+
+    def layer_path(self, area_id, layer, version=None):
+        # Saves from before layers were versioned have a single copy
+        suffix = "" if version is None else f"_{version}"
+        return os.path.join(self.directory,
+                            f"area_{area_id}_{layer}{suffix}.npy")
+
+    def exists(self):
+        """Is there a saved game?"""
+        self.wait()
+        return os.path.exists(self.header_path)
+
+    def delete(self):
+        """Removes the saved game."""
+        self.wait()
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
+
+    def save(self, world):
+        """Writes the world header and every changed area."""
+        self.wait()
+        snapshot, saved = self.snapshot(world)
+        self.write(*snapshot)
+        self.mark_clean(saved)
+
+    def save_area(self, area):
+        """Writes a single area's chunk, without the world header."""
+
+        self.wait()
+
+        references = self.references(area.world)
+        references[id(area.world)] = ("world",)
+        references[id(area.world.player)] = ("player",)
+
+        layers = {}
+        chunk = self.snapshot_area(area, references, layers)
+        self.write_files({area.area_id: chunk}, layers)
+
+    def write_in_background(self, world):
+        """Pickles the world now, then compresses and writes it on
+        another thread. Only the compression and writing are taken off
+        the game thread; pickling still holds up play."""
+
+        # Saves are written one at a time, in order, and any error in
+        # the last one is raised before starting the next
+        self.wait()
+        if self.writer is None:
+            self.writer = ThreadPoolExecutor(max_workers=1)
+
+        snapshot, saved = self.snapshot(world)
+        self.pending = (self.writer.submit(self.write, *snapshot), saved)
+
+    def wait(self):
+        """Blocks until any background write has finished, raising
+        any error it hit."""
+        if self.pending is not None:
+            (pending, saved), self.pending = self.pending, None
+            pending.result()
+            self.mark_clean(saved)
+
+    def mark_clean(self, saved):
+        """Marks the areas in a written snapshot as saved."""
+
+        # Areas changed since the snapshot have lost the marker
+        marker, areas = saved
+        for area in areas:
+            if area.dirty is marker:
+                area.dirty = False
+
+    def snapshot(self, world):
+        """Returns the world header and each changed area's chunk as
+        bytes, copies of any mapped tile layers, and the ids of every
+        area in the world; then the marker left on the changed areas,
+        and the areas themselves."""
+
+        area_ids = [area.area_id for area in world.areas]
+        references = self.references(world)
+
+        # Saved areas can be read back from here once unloaded
+        world.saves = self
+
+        # The header holds the world and the player
+        file = io.BytesIO()
+        pickle.dump(area_ids, file)
+        ChunkPickler(file, references).dump(world)
+        header = file.getvalue()
+
+        # Each chunk refers back to the world and the player
+        references[id(world)] = ("world",)
+        references[id(world.player)] = ("player",)
+
+        # Captured areas stay dirty until they have been written
+        marker = object()
+        captured = []
+
+        chunks = {}
+        layers = {}
+        for area in world.areas:
+            if not area.dirty:
+                continue
+
+            # Unloaded areas that have changed are copied from the swap
+            if area.loaded:
+                chunks[area.area_id] = self.snapshot_area(area, references,
+                                                          layers)
+            else:
+                chunks[area.area_id] = world.swap.read(
+                    world.swap.chunk_path(area.area_id)).getvalue()
+
+            area.dirty = marker
+            captured.append(area)
+
+        return (header, chunks, layers, area_ids), (marker, captured)
+
+    def references(self, world):
+        """Returns the keys saved in place of each area and the engine,
+        by id."""
+
+        # Areas are saved in their own chunks; the engine isn't saved
+        references = {id(area): ("area", area.area_id)
+                      for area in world.areas}
+        if world.engine is not None:
+            references[id(world.engine)] = ("engine",)
+
+        return references
+
+    def snapshot_area(self, area, references, layers):
+        """Returns a single area's chunk as bytes; mapped tile layers
+        are copied into the layers dict instead."""
+
+        state = area.__getstate__()
+
+        # Tiles are stored as raw arrays; visibility is recalculated
+        tiles = state.pop("tiles")
+        explored = state.pop("explored_tiles")
+        del state["visible_tiles"]
+
+        file = io.BytesIO()
+        if self.mapped:
+
+            # Each save writes new layer files, as play may still have
+            # the last ones mapped, and mapped files can't always be
+            # replaced
+            state["layer_version"] = version = uuid4().hex
+            layers[self.layer_path(area.area_id, "tiles", version)] = \
+                np.array(tiles, order="F")
+            layers[self.layer_path(area.area_id, "explored", version)] = \
+                np.array(explored, order="F")
+        else:
+            np.save(file, tiles)
+            np.save(file, explored)
+
+        ChunkPickler(file, references).dump(state)
+        return file.getvalue()
+
+    def write(self, header, chunks, layers, area_ids):
+        """Writes a snapshot, then removes any files it doesn't need."""
+
+        self.write_files(chunks, layers, header)
+
+        # Drop files left over from a bigger world
+        saved = {str(area_id) for area_id in area_ids}
+        for name in os.listdir(self.directory):
+            if name.startswith("area_") and \
+                    name[5:].split(".")[0].split("_")[0] not in saved:
+                os.remove(os.path.join(self.directory, name))
+
+        # And the layers replaced by this save's, unless they are still
+        # mapped somewhere that won't let them go; they are tried again
+        # next time the area is saved
+        rewritten = {str(area_id) for area_id in chunks}
+        written = {os.path.basename(path) for path in layers}
+        for name in os.listdir(self.directory):
+            if name.startswith("area_") and name.endswith(".npy") \
+                    and name[5:].split("_")[0] in rewritten \
+                    and name not in written:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def write_files(self, chunks, layers, header=None):
+        """Compresses and writes chunks, layers and the header, replacing
+        files only once all of them have been written."""
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Mapped layers are written raw, so they can be mapped again
+        for path, layer in layers.items():
+            with open(path + ".tmp", "wb") as file:
+                np.save(file, layer)
+
+        # The header goes last, so it never names a missing chunk
+        paths = [self.chunk_path(area_id) for area_id in chunks]
+        data = list(chunks.values())
+        if header is not None:
+            paths.append(self.header_path)
+            data.append(header)
+
+        for path, chunk in zip(paths, data):
+            with open(path + ".tmp", "wb") as file:
+                file.write(compress(chunk, self.codec, self.level))
+
+        for path in list(layers) + paths:
+            os.replace(path + ".tmp", path)
+
+    def read(self, path):
+        """Returns the decompressed contents of a file."""
+        with open(path, "rb") as file:
+            return io.BytesIO(decompress(file.read()))
+
+    def load(self, lazy=True):
+        """Reads the saved world; unless told otherwise, areas are only
+        read from their chunks when first used."""
+
+        self.wait()
+
+        # Areas are created empty, then filled from their chunks
+        file = self.read(self.header_path)
+        area_ids = pickle.load(file)
+        areas = {area_id: Area.__new__(Area) for area_id in area_ids}
+
+        world = ChunkUnpickler(file, self.objects(areas)).load()
+        world.saves = self
+        objects = self.objects(areas, world)
+
+        for area_id, area in areas.items():
+            area.unload(world, area_id,
+                        partial(self.load_area, area, area_id, objects))
+            if not lazy:
+                area.load()
+
+        return world
+
+    def objects(self, areas, world=None):
+        """Returns the objects that chunks refer to, by key."""
+
+        objects = {("area", area_id): area
+                   for area_id, area in areas.items()}
+        objects[("engine",)] = None
+
+        if world is not None:
+            objects[("world",)] = world
+            objects[("player",)] = world.player
+
+        return objects
+
+    def load_area(self, area, area_id, objects):
+        """Fills an empty area from its chunk."""
+
+        # The chunk may still be being written
+        self.wait()
+
+        self.restore_area(area, area_id, self.read(self.chunk_path(area_id)),
+                          objects)
+        area.dirty = False
+
+    def restore_area(self, area, area_id, file, objects):
+        """Fills an area from a chunk, as made by snapshot_area."""
+
+        # Chunks hold their own tiles, unless the layers are mapped
+        magic = np.lib.format.MAGIC_PREFIX
+        if file.getbuffer()[:len(magic)] == magic:
+            tiles = np.load(file)
+            explored = np.load(file)
+            state = ChunkUnpickler(file, objects).load()
+        else:
+            state = ChunkUnpickler(file, objects).load()
+
+            # Copy-on-write, so play never changes the saved files
+            version = state.pop("layer_version", None)
+            tiles = np.load(self.layer_path(area_id, "tiles", version),
+                            mmap_mode="c")
+            explored = np.load(self.layer_path(area_id, "explored", version),
+                               mmap_mode="c")
+
+        state["tiles"] = tiles
+        state["explored_tiles"] = explored
+
+        # Zeroed memory isn't resident until the area is viewed
+        state["visible_tiles"] = np.zeros(tiles.shape, dtype=bool,
+                                          order="F")
+
+        area.__setstate__(state)
@@ -0,0 +1,246 @@
+"""
+This file contains the implementation of the Simulation class.
+A simulation plays the game without a window, driving the player
+with a simple script, so that turn processing can be measured.
+"""
+
+import random
+import tracemalloc
+from functools import partial
+from time import perf_counter
+
+from .engine import Engine
+from .exceptions import Impossible
+from .constants import DIRECTIONS
+from .states.play_state import Play
+from ..environments.world import World
+from ..environments.area import Area
+from ..environments.features import Feature
+from ..entities.entity import Entity
+from ..entities.player_entity import Player
+from ..entities.conditions import Condition
+from ..entities.minds.brawler_mind import Brawler
+from ..entities.actions import Surge, Wait
+
+
+# Scenarios - each builds a world on the given engine
+
+def build_surface(engine):
+    """The standard new game world."""
+    engine.create_world()
+
+
+def build_caverns(engine):
+    """The standard world, with the player beside the cavern Brawlers."""
+    engine.create_world()
+    engine.world.player.change_area(engine.world.areas[1])
+    engine.world.player.set_loc(14, 22)
+
+
+def build_crowd(count, mind, engine, width=80, height=50):
+    """An open area filled row by row with entities, player in the middle."""
+
+    world = World(engine)
+    engine.world = world
+
+    area = Area(width, height, world, "crowd")
+    world.areas.append(area)
+
+    player = Player("You", "A person", width // 2, height // 2)
+    world.player = player
+    area.add_contents(player)
+
+    # Fill the area row by row, leaving the player's tile free
+    crowd = []
+    for i in range(count + 1):
+        x, y = i % width, i // width
+        if (x, y) != player.loc and len(crowd) < count:
+            crowd.append(Entity("other", "Not you.", x, y, mind=mind))
+    area.add_contents(crowd)
+
+
+def build_block(size, engine, width=80, height=50):
+    """An open area with a square block of Brawlers beside the player."""
+
+    world = World(engine)
+    engine.world = world
+
+    area = Area(width, height, world, "block")
+    world.areas.append(area)
+
+    # Centre the block, with the player just to its left
+    left, top = (width - size) // 2, (height - size) // 2
+    player = Player("You", "A person", left - 2, height // 2)
+    world.player = player
+    area.add_contents(player)
+
+    area.add_contents([Entity("other", "Not you.", x, y, mind=Brawler)
+                       for x in range(left, left + size)
+                       for y in range(top, top + size)])
+
+
+scenarios = {
+    "surface": build_surface,
+    "caverns": build_caverns,
+    "sparse": partial(build_block, 5),
+    "dense": partial(build_block, 15),
+    "swarm": partial(build_block, 30)
+}
+
+
+# Policies - each chooses the player's next action
+
+def wander(simulation):
+    """Move in a random direction, or occasionally wait."""
+    if simulation.rng.random() < 0.2:
+        return Wait()
+    return Surge(*simulation.rng.choice(list(DIRECTIONS.values())))
+
+
+def wait(simulation):
+    """Always pass the turn."""
+    return Wait()
+
+
+policies = {
+    "wander": wander,
+    "wait": wait
+}
+
+
+# Methods timed for each subsystem; AI time includes FOV and pathing
+
+subsystems = {
+    "AI": (Entity, "take_action"),
+    "FOV": (Area, "calculate_fov"),
+    "pathing": (Area, "get_distance_map"),
+    "features": (Feature, "check_update"),
+    "conditions": (Condition, "update")
+}
+
+
+class SimulationReport:
+    """The results of a simulation run."""
+
+    def __init__(self, turns, elapsed, subsystems, peak_memory=None):
+        self.turns = turns
+        self.elapsed = elapsed
+        self.subsystems = subsystems
+        self.peak_memory = peak_memory
+
+    @property
+    def turns_per_second(self):
+        return self.turns / self.elapsed if self.elapsed else 0
+
+    def summary(self):
+        """Returns the report as a list of lines."""
+
+        lines = [f"{self.turns} turns in {self.elapsed:.3f}s "
+                 f"({self.turns_per_second:.1f} turns/s)"]
+
+        for name, time in self.subsystems.items():
+            share = time / self.elapsed * 100 if self.elapsed else 0
+            lines.append(f"  {name:<11}{time * 1000:10.1f}ms {share:5.1f}%")
+
+        if self.peak_memory is not None:
+            lines.append(f"  peak memory {self.peak_memory / 1024:.0f}KiB")
+
+        return lines
+
+
+class Simulation:
+    """Runs the game headlessly with a scripted player."""
+
+    def __init__(self, scenario="caverns", seed=0, policy="wander",
+                 hardy=True):
+
+        # The game itself draws on the shared random generator
+        random.seed(seed)
+        self.rng = random.Random(seed)
+
+        # The engine is needed for messages, but no window is opened
+        self.engine = Engine("simulation", 80, 60, "./assets/arial12x12.png")
+
+        build = scenarios[scenario] if isinstance(scenario, str) \
+            else scenario
+        build(self.engine)
+
+        self.play = Play(self.engine)
+        self.engine.set_state(self.play)
+
+        self.policy = policies[policy] if isinstance(policy, str) \
+            else policy
+
+        # Keep the player alive so runs aren't cut short
+        if hardy:
+            player = self.engine.world.player
+            player.body.bonus_health = player.body.health = 10 ** 9
+
+    @property
+    def world(self):
+        return self.engine.world
+
+    @property
+    def finished(self):
+        """Has the game ended?"""
+        return self.world.player.body.dead
+
+    def step(self):
+        """Takes a single player action, then lets the world respond."""
+
+        try:
+            self.world.player.take_action(self.policy(self))
+        except Impossible:
+            return
+
+        # Actions that open menus don't pass the turn
+        if self.engine.state is self.play:
+            self.world.pass_turn()
+        else:
+            self.engine.set_state(self.play)
+
+    def run(self, turns, trace_memory=False):
+        """Plays a number of turns, timing each subsystem."""
+
+        timings = {name: 0 for name in subsystems}
+        originals = {}
+
+        # Wrap each subsystem's method with a timer
+        for name, (cls, method) in subsystems.items():
+            originals[name] = getattr(cls, method)
+            setattr(cls, method, self.timed(originals[name], timings, name))
+
+        if trace_memory:
+            tracemalloc.start()
+
+        try:
+            start_turn = self.world.turn
+            start = perf_counter()
+            while self.world.turn - start_turn < turns and not self.finished:
+                self.step()
+            elapsed = perf_counter() - start
+
+        finally:
+            for name, (cls, method) in subsystems.items():
+                setattr(cls, method, originals[name])
+
+            peak = None
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+        return SimulationReport(self.world.turn - start_turn, elapsed,
+                                timings, peak)
+
+    @staticmethod
+    def timed(function, timings, name):
+        """Returns a version of a function that logs its running time."""
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[name] += perf_counter() - start
+
+        return wrapper
@@ -0,0 +1,47 @@
+"""
+This file contains the implementation of the Slotted class.
+Slotted classes keep their attributes in __slots__ rather than a
+per-instance dict, which saves memory when there are many of them.
+"""
+
+
+# Names of every slot in each class, including inherited ones
+slot_names = {}
+
+
+def get_slot_names(cls):
+    """Returns the names of all the slots a class's instances have."""
+
+    if cls not in slot_names:
+        slot_names[cls] = dict.fromkeys(
+            name for base in reversed(cls.__mro__)
+            for name in base.__dict__.get("__slots__", ()))
+    return slot_names[cls]
+
+
+class Slotted:
+    """A base for classes that store their attributes in slots.
+
+    They are pickled as a plain dict of attributes, just as they were
+    before slots were used, so old and new saves load either way."""
+
+    __slots__ = ()
+
+    def __getstate__(self):
+
+        # Unset slots are left out, as missing attributes were before
+        state = {}
+        for name in get_slot_names(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+
+        # Attributes that have since been removed are dropped
+        names = get_slot_names(type(self))
+        for name, value in state.items():
+            if name in names:
+                setattr(self, name, value)
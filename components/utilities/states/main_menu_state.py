@@ -2,7 +2,6 @@
 This file contains the implementation of the MainMenu class.
 This class begins the game and presents the player with options.
 """
-from os.path import exists
 from .menus import MenuOption, Menu
 
 
@@ -16,6 +15,6 @@ class MainMenu(Menu):
                                    self.engine.new_game),
                         MenuOption("Quit Game", self.quit)]
 
-        if exists('./savefile.sav'):
+        if self.engine.saves.exists():
             self.options.insert(1, MenuOption("Continue Game",
                                               self.engine.load_game))
\ No newline at end of file
@@ -10,7 +10,7 @@ from ...entities.entity import Entity
 from .state import State
 from .in_game_menu import InGameMenu
 from .text_states import MessageScroller
-from ..constants import DIRECTIONS, COLOURS as C
+from ..constants import DIRECTIONS, AUTOSAVE_INTERVAL, COLOURS as C
 from ..messages import SystemMessage
 from ..exceptions import Impossible
 import tcod
@@ -22,6 +22,10 @@ class Play(State):
     def __init__(self, engine):
         super().__init__(engine)
 
+        # Snapshot of the drawn map, redrawn only when the game changes
+        self.map_layer = None
+        self.map_dirty = True
+
     def ev_keydown(self, event):
         """Take keyboard input."""
 
@@ -108,44 +112,29 @@ class Play(State):
             self.engine.message_log.add(SystemMessage(ex.args[0]))
             return
 
+        # The world may have changed, so the map needs redrawing
+        self.map_dirty = True
+
         # If the state hasn't changed (turns passing as normal),
         if self.engine.state == self:
 
-            # Update the player state
-            self.engine.world.player.readiness -= 100
-            self.engine.world.player.update()
-
-            # Let all other entities take turns
-            while not self.engine.world.player.ready:
-                self.engine.world.player.prepare()
-                for entity in self.engine.world.entities - \
-                        {self.engine.world.player}:
-                    entity.consider_action()
+            # Let the rest of the world take its turn
+            self.engine.world.pass_turn()
 
-                # Update all the features
-                for feature in self.engine.world.area.features:
-                    feature.check_update()
-
-                    # If the feature is visible and mappable, mark it as discovered.
-                    if hasattr(feature, "discovered") and not feature.discovered:
-                        if self.engine.world.area.is_visible(feature.x, feature.y):
-                            feature.discovered = True
-
-                # Render current state
-                self.engine.console.clear()
-                self.render(self.engine.console)
+            # Save every so often, unless the game has ended
+            if self.engine.state == self \
+                    and self.engine.world.turn % AUTOSAVE_INTERVAL == 0:
+                self.engine.autosave()
 
     def render(self, console):
         """Display the current state of the game world."""
 
-        # Update tile appearances
-        self.engine.world.area.update_tile_states(self.engine.world.player)
+        # Redraw the map if anything has happened since it was last drawn
+        if self.map_dirty:
+            self.render_map()
 
-        # Draw the tiles
-        self.render_tiles(console)
-
-        # Display the area contents
-        self.render_contents(console)
+        # Copy the map onto the screen
+        self.map_layer.blit(console)
 
         # Display the status pane
         self.render_status_pane(console, 1, 51, 30)
@@ -159,6 +148,29 @@ class Play(State):
 
     # Utility rendering functions
 
+    def render_map(self):
+        """Draw the tiles and contents of the area onto the map layer."""
+
+        area = self.engine.world.area
+
+        # Make a layer to fit the area, if there isn't one already
+        if self.map_layer is None or \
+                (self.map_layer.width, self.map_layer.height) != \
+                (area.width, area.height):
+            self.map_layer = tcod.console.Console(area.width, area.height,
+                                                  order="F")
+
+        # Update tile appearances
+        area.update_tile_states(self.engine.world.player)
+
+        # Draw the tiles
+        self.render_tiles(self.map_layer)
+
+        # Display the area contents
+        self.render_contents(self.map_layer)
+
+        self.map_dirty = False
+
     def render_tiles(self, console):
         """Render the tile map."""
 
@@ -172,21 +184,24 @@ class Play(State):
     def render_contents(self, console):
         """Render the contents of a specific area."""
 
-        contents = sorted(self.engine.world.area.contents,
-                          key=lambda x: x.render_order.value)
+        area = self.engine.world.area
+
+        # Only explored tiles can show remembered objects
+        remembered = area.explored_tiles & ~area.visible_tiles
 
-        for thing in contents:
+        # Draw each layer in turn, lowest first
+        for layer in area.layers.values():
 
-            # If the play can see it
-            if self.engine.world.area.is_visible(thing.x, thing.y):
-                # Show the thing
+            # Show the things the player can see
+            for thing in layer.select(area.visible_tiles):
                 console.print(thing.x, thing.y, thing.char,
                               thing.colour)
-            # Or if it has been mapped
-            elif (hasattr(thing, "discovered") and thing.discovered):
-                # Show the thing
-                console.print(thing.x, thing.y, thing.char,
-                              C["GREY"])
+
+            # And any that have been mapped
+            for thing in layer.select(remembered):
+                if hasattr(thing, "discovered") and thing.discovered:
+                    console.print(thing.x, thing.y, thing.char,
+                                  C["GREY"])
 
     def render_info_pane(self, console, x, y, height):
         """Displays information about the tile under the mouse."""
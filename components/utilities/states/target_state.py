@@ -8,6 +8,7 @@ from ...entities.abilities import FireAbility, SpellAbility
 from ..constants import DIRECTIONS, COLOURS as C
 from ...entities.actions import Throw, Fire, Evoke
 import tcod
+import numpy as np
 from .text_states import DescriptionScroller
 
 
@@ -106,6 +107,19 @@ class TargetState(State):
         console.tiles_rgb["bg"][x, y] = colour
         console.tiles_rgb["fg"][x, y] = C["BLACK"]
 
+    def highlight_tiles(self, mask, console, colour=C["PATH"]):
+        """Highlight every tile where a map of the area is True."""
+        width, height = mask.shape
+        console.tiles_rgb["bg"][:width, :height][mask] = colour
+        console.tiles_rgb["fg"][:width, :height][mask] = C["BLACK"]
+
+    def tint_tiles(self, mask, console, colour):
+        """Blend a colour into the background of every tile where a map
+        of the area is True."""
+        width, height = mask.shape
+        bg = console.tiles_rgb["bg"][:width, :height]
+        bg[mask] = bg[mask] // 2 + np.array(colour, dtype=np.uint8) // 2
+
 
 class LookState(TargetState):
 
@@ -173,6 +187,14 @@ class RangeState(TargetState):
         self.impact = None
         self.path = []
 
+        # What the path was last calculated for
+        self.path_key = None
+
+        # Every tile that can be aimed at, worked out once
+        self.targets = self.actor.area.get_targets_in_range(self.actor,
+                                                            self.range)
+        self.target_tiles = np.nonzero(self.targets)
+
         self.calculate_path()
 
     @property
@@ -183,6 +205,17 @@ class RangeState(TargetState):
     def calculate_path(self):
         """Identify the point of impact, based on the range."""
 
+        # Get the range
+        limit = self.range if self.range else self.weapon.range
+
+        # Keep the last path unless the aim or the area has changed
+        area = self.actor.area
+        key = (self.actor.loc, self.cursor, limit, area.terrain_revision,
+               area.occupancy_revision)
+        if key == self.path_key:
+            return
+        self.path_key = key
+
         if self.actor.loc == self.cursor:
             # Set the defaults
 
@@ -190,9 +223,6 @@ class RangeState(TargetState):
             self.path = []
             return
 
-        # Get the range
-        limit = self.range if self.range else self.weapon.range
-
         # Get the direct route to the target
         path = self.actor.area.get_direct_path_to(self.actor.loc,
                                                   self.cursor)[1:]
@@ -230,31 +260,50 @@ class RangeState(TargetState):
 
     def move_cursor(self, direction, mod):
         """Move the cursor in a particular direction with the keys;
-        bound by the map and the range"""
+        it stops at the last tile on the way that can be aimed at"""
         x, y = self.cursor
-        dx = DIRECTIONS[direction][0] * 5 if mod else DIRECTIONS[direction][0]
-        dy = DIRECTIONS[direction][1] * 5 if mod else DIRECTIONS[direction][1]
-        nx, ny = x + dx, y + dy
-        dist = self.engine.world.area.distance_between(self.actor.loc,
-                                                       (nx, ny))
-        if self.engine.world.area.in_bounds(nx, ny) and dist <= self.range:
-            self.set_cursor(nx, ny)
+        dx, dy = DIRECTIONS[direction]
+        for steps in range(5 if mod else 1, 0, -1):
+            nx, ny = x + dx * steps, y + dy * steps
+            if self.engine.world.area.in_bounds(nx, ny) \
+                    and self.targets[nx, ny]:
+                self.set_cursor(nx, ny)
+                return
+
+    def nearest_target(self, x, y):
+        """Returns the closest tile to a point that can be aimed at."""
+        xs, ys = self.target_tiles
+        closest = np.argmin((xs - x) ** 2 + (ys - y) ** 2)
+        return int(xs[closest]), int(ys[closest])
+
+    def ev_mousemotion(self, event):
+        """Follow the mouse over the map, snapping to tiles that can be
+        aimed at."""
+        if self.engine.world.area.in_bounds(event.tile.x, event.tile.y):
+            self.set_cursor(*self.nearest_target(event.tile.x, event.tile.y))
+
+    def ev_mousebuttondown(self, event):
+        """Selects on mouse click, if the mouse is over the map."""
+        if self.engine.world.area.in_bounds(event.tile.x, event.tile.y):
+            self.resume_with_selection()
 
     def render_impact_radius(self, console, effect):
         """Highlight the tiles that would be affected by the impact."""
 
         # Get the tiles in the area
         radius = effect.impact_radius
-        tiles = self.engine.world.area.get_tiles_in_range(self.impact[0],
-                                                          self.impact[1],
-                                                          radius)
+        tiles = self.engine.world.area.get_range_mask(self.impact[0],
+                                                      self.impact[1],
+                                                      radius)
 
-        # Highlight each tile
-        for tile in tiles:
-            self.highlight_tile(tile[0], tile[1], console, C["RADIUS"])
+        # Highlight them all at once
+        self.highlight_tiles(tiles, console, C["RADIUS"])
 
     def render_cursor(self, console):
 
+        # Shade everything that can be aimed at
+        self.tint_tiles(self.targets, console, C["RANGE"])
+
         # Work out where the item will hit
         self.calculate_path()
 